@@ -1,6 +1,5 @@
 """CLI for Eero Prometheus Exporter."""
 
-import asyncio
 import logging
 from pathlib import Path
 
@@ -15,7 +14,7 @@ from . import __version__
 from .collector import EeroCollector
 from .config import DEFAULT_PORT, DEFAULT_SESSION_FILE, ExporterConfig
 from .eero_adapter import EeroAPIError, EeroAuthError, EeroClient
-from .server import run_server
+from .server import run_async, run_server
 
 app = typer.Typer(
     name="eero-exporter",
@@ -103,7 +102,7 @@ def login(
         console.print("\n[green]✓[/green] Login successful!")
         console.print(f"[dim]Session saved to: {session_path}[/dim]\n")
 
-    asyncio.run(_login())
+    run_async(_login())
 
 
 @app.command()
@@ -192,7 +191,7 @@ def validate(
                     console.print(f"[bold red]✗[/bold red] API error: {e}")
                 raise typer.Exit(1)
 
-    asyncio.run(_validate())
+    run_async(_validate())
 
 
 @app.command()
@@ -247,7 +246,7 @@ def status(
             name = network.get("name", "Unknown")
             status = network.get("status", "unknown")
             url = network.get("url", "")
-            network_id = str(url).rstrip("/").split("/")[-1] if url else "unknown"
+            network_id = EeroClient.extract_network_id(url) if url else "unknown"
 
             status_color = "green" if status in ("connected", "online") else "red"
             table.add_row(name, f"[{status_color}]{status}[/{status_color}]", network_id)
@@ -255,7 +254,7 @@ def status(
         console.print(table)
         console.print()
 
-    asyncio.run(_status())
+    run_async(_status())
 
 
 @app.command()
@@ -290,7 +289,10 @@ def test(
             console=console,
         ) as progress:
             task = progress.add_task("Collecting metrics...", total=None)
-            success = await collector.collect()
+            try:
+                success = await collector.collect()
+            finally:
+                await collector.close()
             progress.remove_task(task)
 
         if success:
@@ -300,7 +302,7 @@ def test(
             console.print("[bold red]✗[/bold red] Metrics collection failed.")
             raise typer.Exit(1)
 
-    asyncio.run(_test())
+    run_async(_test())
 
 
 @app.command()
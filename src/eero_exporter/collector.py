@@ -1,10 +1,27 @@
 """Collector module for gathering eero metrics."""
 
+import asyncio
+import calendar
 import logging
+import re
 import time
+from bisect import bisect_left
+from collections.abc import Coroutine, Mapping
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-from .eero_adapter import EeroAPIError, EeroAuthError, EeroClient
+from .eero_adapter import (
+    DEFAULT_CACHE_TTL,
+    DEFAULT_MAX_CONCURRENCY,
+    EeroAPIError,
+    EeroAuthError,
+    EeroClient,
+    extract_id_from_url,
+    extract_speed_test,
+    served_from_cache,
+)
 from .metrics import (
     ACCOUNT_NETWORKS_COUNT,
     ACTIVITY_ACTIVE_CLIENTS,
@@ -81,6 +98,7 @@ from .metrics import (
     ETHERNET_PORT_SPEED,
     EXPORTER_API_REQUESTS,
     EXPORTER_COLLECTION_INTERVAL,
+    EXPORTER_LAST_COLLECTION_AGE,
     EXPORTER_LAST_COLLECTION_TIMESTAMP,
     EXPORTER_SCRAPE_DURATION,
     EXPORTER_SCRAPE_ERRORS,
@@ -129,64 +147,239 @@ from .metrics import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Info payloads are only rewritten when they change, but are refreshed at
+# least this often (seconds) as a safety net
+INFO_REFRESH_INTERVAL = 3600
+
+# Shared read-only stand-in for missing nested objects in API payloads
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Endpoints counted by EXPORTER_API_REQUESTS
+_API_ENDPOINTS = (
+    "networks",
+    "network",
+    "eeros",
+    "devices",
+    "profiles",
+    "sqm",
+    "premium",
+    "activity",
+    "activity_categories",
+    "backup",
+    "backup_status",
+    "thread",
+    "forwards",
+    "reservations",
+    "blacklist",
+    "diagnostics",
+    "insights",
+)
 
-def _extract_id_from_url(url: Any) -> str:
-    """Extract ID from an API URL."""
-    if not url:
-        return ""
-    url_str = str(url)
-    parts = url_str.rstrip("/").split("/")
-    return parts[-1] if parts else ""
+# Endpoints served from the client's response cache; hits are counted with
+# status="cached" so "success" only counts requests that reached the API
+_CACHED_ENDPOINTS = ("sqm", "premium", "backup")
+
+# Network status values that count as online
+_ONLINE_STATES = frozenset({"connected", "online"})
+
+# WiFi bands as (label, lowest frequency in MHz), with each band's highest
+# frequency in the matching position of _BAND_UPPER_EDGES
+_BANDS = (("2.4GHz", 2400), ("5GHz", 5150), ("6GHz", 5925))
+_BAND_UPPER_EDGES = (2500, 5925, 7125)
+
+# Connection types reported as-is in the device connection_type label
+_CONN_TYPES = frozenset({"wired", "wireless"})
+
+# Eero status values that count as online; the API is not consistent about
+# which of these it reports
+_EERO_ONLINE_STATES = frozenset({"connected", "online", "green", "up", "active", "ok", "healthy"})
+
+# Optional per-eero fields exported as-is: (gauge, field, export as 0/1)
+_EERO_FIELD_GAUGES: tuple[tuple[Any, str, bool], ...] = (
+    (EERO_CONNECTED_WIRED_CLIENTS, "connected_wired_clients_count", False),
+    (EERO_CONNECTED_WIRELESS_CLIENTS, "connected_wireless_clients_count", False),
+    (EERO_UPTIME_SECONDS, "uptime", False),
+    (EERO_LED_ON, "led_on", True),
+    (EERO_UPDATE_AVAILABLE, "update_available", True),
+    (EERO_HEARTBEAT_OK, "heartbeat_ok", True),
+    (EERO_WIRED, "wired", True),
+    (EERO_LED_BRIGHTNESS, "led_brightness", False),
+    (EERO_PROVIDES_WIFI, "provides_wifi", True),
+    (EERO_BACKUP_CONNECTION, "backup_connection", True),
+)
 
+# Metrics written per client device; their children are dropped once the
+# device no longer appears in the network's device list
+_DEVICE_METRICS = frozenset(
+    {
+        DEVICE_INFO,
+        DEVICE_CONNECTED,
+        DEVICE_WIRELESS,
+        DEVICE_BLOCKED,
+        DEVICE_PAUSED,
+        DEVICE_IS_GUEST,
+        DEVICE_SIGNAL_STRENGTH,
+        DEVICE_SIGNAL_AVG,
+        DEVICE_CONNECTION_SCORE,
+        DEVICE_CONNECTION_SCORE_BARS,
+        DEVICE_FREQUENCY,
+        DEVICE_RX_BITRATE,
+        DEVICE_RX_MCS,
+        DEVICE_RX_NSS,
+        DEVICE_RX_BANDWIDTH,
+        DEVICE_TX_BITRATE,
+        DEVICE_TX_MCS,
+        DEVICE_TX_NSS,
+        DEVICE_TX_BANDWIDTH,
+        DEVICE_CHANNEL,
+        DEVICE_PRIORITIZED,
+        DEVICE_PRIVATE,
+        DEVICE_CONNECTED_TO_GATEWAY,
+        DEVICE_LAST_ACTIVE_TIMESTAMP,
+        DEVICE_FIRST_SEEN_TIMESTAMP,
+        DEVICE_WIFI_GENERATION,
+        DEVICE_ADBLOCK_ENABLED,
+    }
+)
 
-def _parse_signal_strength(signal_str: str | None) -> float | None:
-    """Parse signal strength string to float."""
+# Boolean network settings exported as 0/1: (gauge, network details field)
+_NETWORK_FLAG_GAUGES = (
+    (NETWORK_WPA3_ENABLED, "wpa3"),
+    (NETWORK_BAND_STEERING_ENABLED, "band_steering"),
+    (NETWORK_SQM_ENABLED, "sqm"),
+    (NETWORK_UPNP_ENABLED, "upnp"),
+    (NETWORK_THREAD_ENABLED, "thread"),
+    (NETWORK_IPV6_ENABLED, "ipv6_upstream"),
+    (NETWORK_POWER_SAVING_ENABLED, "power_saving"),
+    (NETWORK_BACKUP_INTERNET_ENABLED, "backup_internet_enabled"),
+)
+
+# Thread list fields exported as their length: (gauge, field)
+_THREAD_COUNT_GAUGES = (
+    (THREAD_DEVICE_COUNT, "devices"),
+    (THREAD_BORDER_ROUTER, "border_routers"),
+)
+
+# Per-direction rate info fields: (gauge, field)
+_RX_RATE_GAUGES = (
+    (DEVICE_RX_MCS, "mcs"),
+    (DEVICE_RX_NSS, "nss"),
+    (DEVICE_RX_BANDWIDTH, "bandwidth"),
+)
+_TX_RATE_GAUGES = (
+    (DEVICE_TX_MCS, "mcs"),
+    (DEVICE_TX_NSS, "nss"),
+    (DEVICE_TX_BANDWIDTH, "bandwidth"),
+)
+
+# Leading number of a signal string such as "-55 dBm"
+_SIGNAL_RE = re.compile(r"\s*(-?\d+(?:\.\d+)?)")
+
+# ISO-8601 timestamp with a Z or numeric UTC offset
+_ISO_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?"
+    r"(Z|[+-]\d{2}:?\d{2})"
+)
+
+# Number plus optional unit, e.g. "866.7 Mbit/s" or "2.5 Gbps"
+_BITRATE_RE = re.compile(r"\s*(\d+(?:\.\d+)?)\s*(?:Mbit/s|Mbps)?\s*")
+_SPEED_RE = re.compile(r"\s*(\d+(?:\.\d+)?)\s*(?:([GMK])B?(?:PS)?)?\s*", re.IGNORECASE)
+
+
+def _parse_signal_strength(signal_str: str | float | None) -> float | None:
+    """Parse signal strength string (e.g. "-55 dBm") to float."""
     if not signal_str:
         return None
-    try:
-        return float(signal_str.replace(" dBm", "").strip())
-    except (ValueError, AttributeError):
+    if isinstance(signal_str, (int, float)):
+        return float(signal_str)
+    if not isinstance(signal_str, str):
         return None
+    return _parse_signal_str(signal_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_signal_str(signal_str: str) -> float | None:
+    """Parse a signal strength string, memoized by the raw string."""
+    match = _SIGNAL_RE.match(signal_str)
+    return float(match.group(1)) if match else None
 
 
 def _parse_bitrate(bitrate_str: str | None) -> float | None:
     """Parse bitrate string to Mbps float."""
-    if not bitrate_str:
-        return None
-    try:
-        cleaned = bitrate_str.replace(" Mbit/s", "").replace(" Mbps", "").strip()
-        return float(cleaned)
-    except (ValueError, AttributeError):
+    if not bitrate_str or not isinstance(bitrate_str, str):
         return None
+    return _parse_bitrate_str(bitrate_str)
+
 
+@lru_cache(maxsize=4096)
+def _parse_bitrate_str(bitrate_str: str) -> float | None:
+    """Parse a bitrate string, memoized by the raw string."""
+    match = _BITRATE_RE.fullmatch(bitrate_str)
+    return float(match.group(1)) if match else None
 
-def _parse_speed_mbps(speed_str: str | None) -> float | None:
+
+def _parse_speed_mbps(speed_str: str | float | None) -> float | None:
     """Parse ethernet speed string to Mbps."""
-    if not speed_str:
-        return None
-    try:
-        speed_str = speed_str.strip().upper()
-        if "GBPS" in speed_str or speed_str.endswith("G"):
-            num = float(speed_str.replace("GBPS", "").replace("G", "").strip())
-            return num * 1000
-        if "MBPS" in speed_str or speed_str.endswith("M"):
-            num = float(speed_str.replace("MBPS", "").replace("M", "").strip())
-            return num
+    if isinstance(speed_str, (int, float)) and not isinstance(speed_str, bool):
         return float(speed_str)
-    except (ValueError, AttributeError):
+    if not speed_str or not isinstance(speed_str, str):
         return None
+    return _parse_speed_str(speed_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_speed_str(speed_str: str) -> float | None:
+    """Parse an ethernet speed string, memoized by the raw string."""
+    match = _SPEED_RE.fullmatch(speed_str)
+    if not match:
+        return None
+    num = float(match.group(1))
+    unit = (match.group(2) or "M").upper()
+    if unit == "G":
+        return num * 1000
+    if unit == "K":
+        return num / 1000
+    return num
 
 
 def _parse_timestamp(timestamp_str: str | None) -> float | None:
     """Parse ISO timestamp string to Unix epoch."""
-    if not timestamp_str:
+    if not timestamp_str or not isinstance(timestamp_str, str):
         return None
-    try:
-        from datetime import datetime
+    return _parse_iso_timestamp(timestamp_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(timestamp_str: str) -> float | None:
+    """Parse an ISO timestamp string, memoized by the raw string.
 
+    Timestamps such as last reboot, first seen or the last speed test only
+    change occasionally, so steady-state collections hit the cache.
+    """
+    match = _ISO_RE.fullmatch(timestamp_str)
+    if match:
+        *fields, fraction, tz = match.groups()
+        year, month, day, hour, minute, second = map(int, fields)
+        if not (
+            1 <= month <= 12
+            and 1 <= day <= calendar.monthrange(year, month)[1]
+            and hour < 24
+            and minute < 60
+            and second < 60
+        ):
+            return None
+        epoch = float(calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0)))
+        if fraction:
+            epoch += int(fraction[:6].ljust(6, "0")) / 1e6
+        if tz != "Z":
+            offset = int(tz[1:3]) * 3600 + int(tz[-2:]) * 60
+            epoch -= offset if tz[0] == "+" else -offset
+        return epoch
+    # Naive or unusual timestamps keep the datetime semantics (local time)
+    try:
         dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
         return dt.timestamp()
-    except (ValueError, TypeError):
+    except ValueError:
         return None
 
 
@@ -201,18 +394,21 @@ def _frequency_to_band(frequency: int | None) -> str:
     """
     if not frequency:
         return "unknown"
-    if 2400 <= frequency <= 2500:
-        return "2.4GHz"
-    if 5150 <= frequency <= 5925:
-        return "5GHz"
-    if 5925 <= frequency <= 7125:
-        return "6GHz"
+    band = bisect_left(_BAND_UPPER_EDGES, frequency)
+    if band < len(_BANDS):
+        label, lower_edge = _BANDS[band]
+        if frequency >= lower_edge:
+            return label
     return "unknown"
 
 
+@lru_cache(maxsize=4096)
 def _normalize_manufacturer(manufacturer: str | None) -> str:
     """Normalize manufacturer name for consistent labeling.
 
+    Memoized, since the same few manufacturers repeat across devices and
+    collections.
+
     Args:
         manufacturer: Raw manufacturer string from API
 
@@ -226,8 +422,9 @@ def _normalize_manufacturer(manufacturer: str | None) -> str:
     return name if name else "unknown"
 
 
+@lru_cache(maxsize=4096)
 def _normalize_device_type(device_type: str | None) -> str:
-    """Normalize device type for consistent labeling.
+    """Normalize device type for consistent labeling (memoized).
 
     Args:
         device_type: Raw device type from API
@@ -257,7 +454,8 @@ def _get_connection_type(device: dict[str, Any]) -> str:
     # Check connection_type field as fallback
     conn_type = device.get("connection_type", "")
     if conn_type:
-        return conn_type.lower() if conn_type.lower() in ("wired", "wireless") else "unknown"
+        conn_type = conn_type.lower()
+        return conn_type if conn_type in _CONN_TYPES else "unknown"
     return "unknown"
 
 
@@ -270,7 +468,7 @@ def _get_source_eero_location(device: dict[str, Any]) -> str:
     Returns:
         Location string of source eero or "unknown"
     """
-    source = device.get("source", {})
+    source = device.get("source") or _EMPTY
     if source and isinstance(source, dict):
         location = source.get("location")
         if location:
@@ -287,7 +485,7 @@ def _get_wifi_generation(device: dict[str, Any]) -> int | None:
     Returns:
         WiFi generation (4, 5, 6, 7) or None if not determinable
     """
-    connectivity = device.get("connectivity", {})
+    connectivity = device.get("connectivity") or _EMPTY
     if not connectivity:
         return None
 
@@ -298,7 +496,7 @@ def _get_wifi_generation(device: dict[str, Any]) -> int | None:
 
     # Infer from frequency and capabilities
     frequency = connectivity.get("frequency")
-    rx_rate_info = connectivity.get("rx_rate_info", {})
+    rx_rate_info = connectivity.get("rx_rate_info") or _EMPTY
 
     if not frequency:
         return None
@@ -309,26 +507,101 @@ def _get_wifi_generation(device: dict[str, Any]) -> int | None:
 
     # Check for HE (High Efficiency = WiFi 6) indicators
     if rx_rate_info:
-        # WiFi 6 uses HE (High Efficiency) mode
         mode = rx_rate_info.get("mode", "")
-        if mode and "he" in str(mode).lower():
-            return 6
-        if mode and "ax" in str(mode).lower():
-            return 6
-        # WiFi 5 uses VHT (Very High Throughput)
-        if mode and "vht" in str(mode).lower():
-            return 5
-        if mode and "ac" in str(mode).lower():
-            return 5
-        # WiFi 4 uses HT (High Throughput)
-        if mode and "ht" in str(mode).lower():
-            return 4
-        if mode and "n" in str(mode).lower():
-            return 4
+        if mode:
+            return _wifi_generation_from_mode(str(mode))
+
+    return None
+
 
+@lru_cache(maxsize=256)
+def _wifi_generation_from_mode(mode: str) -> int | None:
+    """Map a PHY rate mode string to a WiFi generation, memoized by the raw mode."""
+    mode = mode.lower()
+    # WiFi 6 uses HE (High Efficiency) mode
+    if "he" in mode or "ax" in mode:
+        return 6
+    # WiFi 5 uses VHT (Very High Throughput)
+    if "vht" in mode or "ac" in mode:
+        return 5
+    # WiFi 4 uses HT (High Throughput)
+    if "ht" in mode or "n" in mode:
+        return 4
     return None
 
 
+def _network_status(details: dict[str, Any]) -> str:
+    """Extract the network status, which may be nested {"status": "online"} or just "online"."""
+    raw_status = details.get("status", "unknown")
+    if isinstance(raw_status, dict):
+        return str(raw_status.get("status", "unknown"))
+    return str(raw_status)
+
+
+def _network_isp(details: dict[str, Any]) -> str:
+    """Extract the ISP name, which may be in isp_name, geo_ip.isp or isp.name."""
+    isp_name = details.get("isp_name")
+    if not isp_name:
+        geo_ip = details.get("geo_ip") or _EMPTY
+        if isinstance(geo_ip, dict):
+            isp_name = geo_ip.get("isp")
+    if not isp_name:
+        isp_data = details.get("isp") or _EMPTY
+        if isinstance(isp_data, dict):
+            isp_name = isp_data.get("name")
+        elif isp_data:
+            isp_name = str(isp_data)
+    return str(isp_name or "unknown")
+
+
+def _first(data: Mapping[str, Any], *keys: str, default: Any = None) -> Any:
+    """Return the first truthy value among alias keys, else the last key's value.
+
+    Same result as ``data.get(a) or data.get(b, default)`` for API fields
+    that are reported under more than one name.
+    """
+    for key in keys[:-1]:
+        value = data.get(key)
+        if value:
+            return value
+    return data.get(keys[-1], default)
+
+
+def _first_resource_value(eero: dict[str, Any], *keys: str) -> Any:
+    """Return the first value found under keys, at the top level or nested.
+
+    eero nodes report some resource figures (memory, temperature) directly,
+    under "resources", or under "hardware" depending on the model.
+    """
+    value = eero.get(keys[0])
+    if value is not None:
+        return value
+    for section in ("resources", "hardware"):
+        nested = eero.get(section) or _EMPTY
+        if isinstance(nested, dict):
+            for key in keys:
+                value = nested.get(key)
+                if value:
+                    break
+            if value is not None:
+                return value
+    return None
+
+
+def _eero_status(eero: dict[str, Any]) -> tuple[str, int]:
+    """Return an eero node's lowercased status and whether it counts as online.
+
+    Args:
+        eero: Eero dictionary from API
+    """
+    status = str(eero.get("status") or "").lower()
+    is_online = 1 if status in _EERO_ONLINE_STATES else 0
+    # If status is empty/unknown but heartbeat is ok, consider it online
+    if is_online == 0 and eero.get("heartbeat_ok", False):
+        is_online = 1
+    return status, is_online
+
+
 class EeroCollector:
     """Collector for eero metrics."""
 
@@ -346,6 +619,8 @@ class EeroCollector:
         include_insights: bool = True,
         timeout: int = 30,
         cookie_file: str | None = None,
+        cache_ttl: int = DEFAULT_CACHE_TTL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """Initialize the collector.
 
@@ -362,6 +637,8 @@ class EeroCollector:
             include_insights: Whether to collect insights metrics
             timeout: Request timeout in seconds
             cookie_file: Path to session/cookie file for authentication
+            cache_ttl: Seconds to reuse slow-changing settings responses (0 disables)
+            max_concurrency: Maximum number of concurrent API requests
         """
         self._include_devices = include_devices
         self._include_profiles = include_profiles
@@ -375,35 +652,165 @@ class EeroCollector:
         self._include_insights = include_insights
         self._timeout = timeout
         self._cookie_file = cookie_file
+        self._cache_ttl = cache_ttl
+        self._max_concurrency = max_concurrency
         self._last_collection_time: float = 0
+        self._last_collection_monotonic = time.monotonic()
         self._cached_data: dict[str, Any] = {}
         self._is_premium: bool = False
         self._networks_count: int = 0
         self._collection_interval: int = 60  # Default, can be overridden
+        self._client: EeroClient | None = None
+        # Counter children resolved up front, one per (endpoint, status)
+        self._api_requests = {
+            (endpoint, status): EXPORTER_API_REQUESTS.labels(endpoint, status)
+            for endpoint in _API_ENDPOINTS
+            for status in ("success", "error")
+        }
+        self._api_requests.update(
+            ((endpoint, "cached"), EXPORTER_API_REQUESTS.labels(endpoint, "cached"))
+            for endpoint in _CACHED_ENDPOINTS
+        )
+        # (metric, label values) -> labelled child, reused across collections
+        self._label_children: dict[tuple[Any, tuple[str, ...]], Any] = {}
+        # (metric, label values) -> (payload items, refresh deadline) for Info metrics
+        self._info_payloads: dict[tuple[Any, tuple[str, ...]], tuple[tuple[Any, ...], float]] = {}
+        # (metric, label values) -> last value written to that gauge child
+        self._last_values: dict[tuple[Any, tuple[str, ...]], Any] = {}
+        # network_id -> device IDs reported by the last successful device fetch
+        self._device_ids: dict[str, set[str]] = {}
 
-    async def collect(self) -> bool:
-        """Collect metrics from the eero API."""
-        start_time = time.monotonic()
-        success = False
+        # Evaluated on every scrape, so a stalled collection loop shows up
+        EXPORTER_LAST_COLLECTION_AGE.set_function(self._collection_age)
 
-        try:
-            async with EeroClient(
+    def _collection_age(self) -> float:
+        """Seconds since the last collection finished (or since startup)."""
+        return time.monotonic() - self._last_collection_monotonic
+
+    def _child(self, metric: Any, *labelvalues: str) -> Any:
+        """Return the child of a labelled metric, resolving it once.
+
+        ``metric.labels()`` hashes the label values and takes the metric's lock
+        on every call. Children are cached here so repeat collections reuse the
+        resolved child instead.
+
+        Args:
+            metric: A labelled Gauge, Counter or Info
+            *labelvalues: Label values in the metric's labelnames order
+
+        Returns:
+            The metric child for those label values
+        """
+        key = (metric, labelvalues)
+        child = self._label_children.get(key)
+        if child is None:
+            child = self._label_children[key] = metric.labels(*labelvalues)
+        return child
+
+    def _set(self, metric: Any, labelvalues: tuple[str, ...], value: Any) -> None:
+        """Set a labelled gauge child, skipping the write if the value is unchanged.
+
+        Most gauges (status flags, client counts, ...) hold the same value from
+        one collection to the next, so the last written value is remembered
+        per child and repeat writes are dropped.
+
+        Args:
+            metric: A labelled Gauge
+            labelvalues: Label values in the metric's labelnames order
+            value: New gauge value
+        """
+        key = (metric, labelvalues)
+        if self._last_values.get(key) == value:
+            return
+        self._child(metric, *labelvalues).set(value)
+        self._last_values[key] = value
+
+    def _set_info(self, metric: Any, labelvalues: tuple[str, ...], payload: dict[str, str]) -> None:
+        """Set an Info metric child, skipping the write if the payload is unchanged.
+
+        Info payloads (model, MAC, ISP, ...) rarely change, yet ``info()``
+        copies the dict and takes a lock on every call. The last payload's
+        items are kept per child and the write is skipped while they match,
+        except that it is redone every INFO_REFRESH_INTERVAL seconds.
+
+        Args:
+            metric: A labelled Info metric
+            labelvalues: Label values in the metric's labelnames order
+            payload: Info key/value pairs
+        """
+        key = (metric, labelvalues)
+        items = tuple(payload.items())
+        now = time.monotonic()
+        cached = self._info_payloads.get(key)
+        if cached is not None and cached[0] == items and cached[1] > now:
+            return
+        self._child(metric, *labelvalues).info(payload)
+        self._info_payloads[key] = (items, now + INFO_REFRESH_INTERVAL)
+
+    def _remove_device_children(self, network_id: str, device_ids: set[str]) -> None:
+        """Remove the per-device metric children of devices that have left a network.
+
+        Without this every client ever seen (guests, visitors, randomized MACs)
+        keeps its series in every DEVICE_* metric for the life of the process.
+
+        Args:
+            network_id: Network the devices belonged to
+            device_ids: IDs of the devices to forget
+        """
+        stale = [
+            key
+            for key in self._label_children
+            if key[0] in _DEVICE_METRICS and key[1][0] == network_id and key[1][1] in device_ids
+        ]
+        for key in stale:
+            metric, labelvalues = key
+            metric.remove(*labelvalues)
+            del self._label_children[key]
+            self._last_values.pop(key, None)
+            self._info_payloads.pop(key, None)
+        _LOGGER.debug("Removed %s series for %s departed devices", len(stale), len(device_ids))
+
+    async def _get_client(self) -> EeroClient:
+        """Return the long-lived API client, opening it on first use.
+
+        The client is kept open across collections so the underlying HTTP
+        connection pool (and its keep-alive connections) is reused.
+        """
+        if self._client is None:
+            client = EeroClient(
                 timeout=self._timeout,
                 cookie_file=self._cookie_file,
-            ) as client:
-                networks = await client.get_networks()
-                EXPORTER_API_REQUESTS.labels(endpoint="networks", status="success").inc()
+                cache_ttl=self._cache_ttl,
+                max_concurrency=self._max_concurrency,
+            )
+            await client.open()
+            self._client = client
+        return self._client
 
-                if not networks:
-                    _LOGGER.warning("No networks found")
-                    return False
+    async def close(self) -> None:
+        """Close the API client. A later collect() transparently reopens it."""
+        if self._client is None:
+            return
+        client, self._client = self._client, None
+        await client.close()
 
-                # Track total networks count
-                self._networks_count = len(networks)
-                ACCOUNT_NETWORKS_COUNT.set(self._networks_count)
+    async def collect(self) -> bool:
+        """Collect metrics from the eero API."""
+        start_time = time.monotonic()
+        success = False
 
-                for network_data in networks:
-                    await self._collect_network_metrics(client, network_data)
+        try:
+            try:
+                found = await self._collect_networks(await self._get_client())
+            except EeroAuthError as e:
+                # The session may have been refreshed on disk since the client
+                # was opened (e.g. by `eero-exporter login`); reload it and retry once
+                _LOGGER.warning("Authentication error, reopening client: %s", e)
+                await self.close()
+                found = await self._collect_networks(await self._get_client())
+
+            if not found:
+                return False
 
             success = True
             # Standard Prometheus "up" metric pattern
@@ -411,20 +818,23 @@ class EeroCollector:
             EXPORTER_SCRAPE_SUCCESS.set(1)  # Deprecated, kept for compatibility
 
         except EeroAuthError as e:
-            _LOGGER.error(f"Authentication error: {e}")
+            _LOGGER.error("Authentication error: %s", e)
             EXPORTER_SCRAPE_ERRORS.labels(error_type="auth").inc()
             EERO_UP.set(0)
             EXPORTER_SCRAPE_SUCCESS.set(0)
+            # Drop the client so the next collection reloads credentials
+            # (e.g. after `eero-exporter login` refreshed the session file)
+            await self.close()
 
         except EeroAPIError as e:
-            _LOGGER.error(f"API error during collection: {e}")
+            _LOGGER.error("API error during collection: %s", e)
             EXPORTER_SCRAPE_ERRORS.labels(error_type="api").inc()
             EERO_UP.set(0)
             if not self._cached_data:
                 EXPORTER_SCRAPE_SUCCESS.set(0)
 
         except Exception as e:
-            _LOGGER.error(f"Unexpected error during collection: {e}", exc_info=True)
+            _LOGGER.error("Unexpected error during collection: %s", e, exc_info=True)
             EXPORTER_SCRAPE_ERRORS.labels(error_type="unknown").inc()
             EERO_UP.set(0)
             EXPORTER_SCRAPE_SUCCESS.set(0)
@@ -433,13 +843,42 @@ class EeroCollector:
             duration = time.monotonic() - start_time
             EXPORTER_SCRAPE_DURATION.set(duration)
             self._last_collection_time = time.time()
+            self._last_collection_monotonic = time.monotonic()
             # Set timestamp metrics for cache monitoring
             EXPORTER_LAST_COLLECTION_TIMESTAMP.set(self._last_collection_time)
             EXPORTER_COLLECTION_INTERVAL.set(self._collection_interval)
-            _LOGGER.info(f"Collection completed in {duration:.2f}s (success={success})")
+            _LOGGER.info("Collection completed in %.2fs (success=%s)", duration, success)
 
         return success
 
+    async def _collect_networks(self, client: EeroClient) -> bool:
+        """Collect metrics for every network on the account.
+
+        Returns:
+            False if the account has no networks, True otherwise
+        """
+        networks = await client.get_networks()
+        self._api_requests["networks", "success"].inc()
+
+        if not networks:
+            _LOGGER.warning("No networks found")
+            return False
+
+        # Track total networks count
+        self._networks_count = len(networks)
+        ACCOUNT_NETWORKS_COUNT.set(self._networks_count)
+
+        # Networks are independent, so collect them concurrently. Let every
+        # network finish, then surface the first failure to collect().
+        results = await asyncio.gather(
+            *(self._collect_network_metrics(client, n) for n in networks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return True
+
     async def _collect_network_metrics(
         self,
         client: EeroClient,
@@ -447,120 +886,144 @@ class EeroCollector:
     ) -> None:
         """Collect metrics for a single network."""
         network_url = network_data.get("url", "")
-        network_id = _extract_id_from_url(network_url)
+        network_id = extract_id_from_url(network_url)
         network_name = network_data.get("name", "Unknown")
 
         if not network_id:
-            _LOGGER.warning(f"Could not extract network ID from {network_url}")
+            _LOGGER.warning("Could not extract network ID from %s", network_url)
             return
 
-        _LOGGER.debug(f"Collecting metrics for network: {network_name} ({network_id})")
+        _LOGGER.debug("Collecting metrics for network: %s (%s)", network_name, network_id)
 
         try:
             network_details = await client.get_network(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="network", status="success").inc()
+            self._api_requests["network", "success"].inc()
         except EeroAPIError as e:
-            _LOGGER.warning(f"Failed to get network details: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="network", status="error").inc()
+            _LOGGER.warning("Failed to get network details: %s", e)
+            self._api_requests["network", "error"].inc()
             network_details = network_data
 
-        # Extract status - may be nested {"status": "online"} or just "online"
-        raw_status = network_details.get("status", "unknown")
-        if isinstance(raw_status, dict):
-            status_str = raw_status.get("status", "unknown")
-        else:
-            status_str = str(raw_status)
-
-        # Extract ISP - may be in geo_ip.isp or isp.name or isp_name
-        isp_name = network_details.get("isp_name")
-        if not isp_name:
-            geo_ip = network_details.get("geo_ip", {})
-            if isinstance(geo_ip, dict):
-                isp_name = geo_ip.get("isp")
-        if not isp_name:
-            isp_data = network_details.get("isp", {})
-            if isinstance(isp_data, dict):
-                isp_name = isp_data.get("name")
-            elif isp_data:
-                isp_name = str(isp_data)
-
-        # Extract public_ip - may be in public_ip or wan_ip
-        public_ip = network_details.get("public_ip") or network_details.get("wan_ip")
-
-        NETWORK_INFO.labels(network_id=network_id).info(
+        network_status = _network_status(network_details)
+
+        self._set_info(
+            NETWORK_INFO,
+            (network_id,),
             {
                 "name": network_name,
-                "status": status_str,
-                "isp": isp_name or "unknown",
-                "public_ip": public_ip or "unknown",
+                "status": network_status,
+                "isp": _network_isp(network_details),
+                "public_ip": _first(network_details, "public_ip", "wan_ip") or "unknown",
                 "wan_type": network_details.get("wan_type") or "unknown",
                 "gateway_ip": network_details.get("gateway_ip") or "unknown",
-            }
+            },
         )
 
-        is_online = 1 if status_str.lower() in ("connected", "online") else 0
-        NETWORK_STATUS.labels(network_id=network_id, name=network_name).set(is_online)
+        is_online = 1 if network_status.lower() in _ONLINE_STATES else 0
+        self._set(NETWORK_STATUS, (network_id, network_name), is_online)
 
-        health = network_details.get("health", {})
+        health = network_details.get("health") or _EMPTY
         if health:
-            internet_health = health.get("internet", {})
-            eero_health = health.get("eero_network", {})
+            internet_health = health.get("internet") or _EMPTY
+            eero_health = health.get("eero_network") or _EMPTY
             if internet_health:
                 is_healthy = 1 if internet_health.get("status") == "connected" else 0
-                HEALTH_STATUS.labels(network_id=network_id, source="internet").set(is_healthy)
+                self._set(HEALTH_STATUS, (network_id, "internet"), is_healthy)
             if eero_health:
                 is_healthy = 1 if eero_health.get("status") == "connected" else 0
-                HEALTH_STATUS.labels(network_id=network_id, source="eero_network").set(is_healthy)
+                self._set(HEALTH_STATUS, (network_id, "eero_network"), is_healthy)
 
-        # Check for speedtest data - eero-api returns "speed_test", but older versions
-        # or direct API calls may return "speed"
-        speed = network_details.get("speed_test") or network_details.get("speed", {})
+        # Speed test results are embedded in the network details, so no extra
+        # request is needed
+        speed = extract_speed_test(network_details)
         if speed:
-            upload = speed.get("up", {})
-            download = speed.get("down", {})
+            upload = speed.get("up") or _EMPTY
+            download = speed.get("down") or _EMPTY
             if upload and "value" in upload:
-                SPEED_UPLOAD_MBPS.labels(network_id=network_id).set(upload["value"])
+                self._set(SPEED_UPLOAD_MBPS, (network_id,), upload["value"])
             if download and "value" in download:
-                SPEED_DOWNLOAD_MBPS.labels(network_id=network_id).set(download["value"])
-            if "date" in speed:
-                try:
-                    from datetime import datetime
-
-                    dt = datetime.fromisoformat(speed["date"].replace("Z", "+00:00"))
-                    SPEED_TEST_TIMESTAMP.labels(network_id=network_id).set(dt.timestamp())
-                except (ValueError, TypeError):
-                    pass
+                self._set(SPEED_DOWNLOAD_MBPS, (network_id,), download["value"])
+            speed_ts = _parse_timestamp(speed.get("date"))
+            if speed_ts is not None:
+                self._set(SPEED_TEST_TIMESTAMP, (network_id,), speed_ts)
 
         await self._collect_network_feature_flags(client, network_id, network_name, network_details)
-        await self._collect_sqm_metrics(client, network_id)
-        await self._collect_eero_metrics(client, network_id, network_name)
+
+        # Each sub-collector fetches its own endpoint, so run them concurrently
+        collectors: list[Coroutine[Any, Any, None]] = [
+            self._collect_eero_metrics(client, network_id, network_name),
+        ]
+
+        # A network reported offline only gets its eeros refreshed (their
+        # status is what alerts on); the remaining endpoints would just return
+        # stale or empty data. An unknown status never skips anything.
+        if not is_online and network_status.lower() not in ("", "unknown"):
+            _LOGGER.info(
+                "Network %s (%s) is %s, skipping sub-collections",
+                network_name,
+                network_id,
+                network_status,
+            )
+            self._zero_network_clients(network_id, network_name)
+        else:
+            collectors.extend(self._network_sub_collectors(client, network_id, network_name))
+
+        # Let every sub-collector finish before surfacing the first failure
+        results = await asyncio.gather(*collectors, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _zero_network_clients(self, network_id: str, network_name: str) -> None:
+        """Report no connected clients for a network whose sub-collections are skipped.
+
+        The device collector does not run while the network is offline, so
+        its client counts and per-device connected flags would otherwise keep
+        their last online values for the whole outage.
+        """
+        if not self._include_devices:
+            return
+        self._set(NETWORK_CLIENTS_COUNT, (network_id, network_name), 0)
+        self._set(GUEST_NETWORK_CONNECTED_CLIENTS, (network_id, network_name), 0)
+        for metric, labelvalues in list(self._label_children):
+            if metric is DEVICE_CONNECTED and labelvalues[0] == network_id:
+                self._set(DEVICE_CONNECTED, labelvalues, 0)
+
+    def _network_sub_collectors(
+        self, client: EeroClient, network_id: str, network_name: str
+    ) -> list[Coroutine[Any, Any, None]]:
+        """Build the enabled per-network sub-collectors beyond the eero metrics."""
+        collectors: list[Coroutine[Any, Any, None]] = [
+            self._collect_sqm_metrics(client, network_id),
+        ]
 
         if self._include_devices:
-            await self._collect_device_metrics(client, network_id, network_name)
+            collectors.append(self._collect_device_metrics(client, network_id, network_name))
 
         if self._include_profiles:
-            await self._collect_profile_metrics(client, network_id)
+            collectors.append(self._collect_profile_metrics(client, network_id))
 
         if self._include_premium:
-            await self._collect_premium_metrics(client, network_id, network_name)
+            collectors.append(self._collect_premium_metrics(client, network_id, network_name))
 
         if self._include_thread:
-            await self._collect_thread_metrics(client, network_id)
+            collectors.append(self._collect_thread_metrics(client, network_id))
 
         if self._include_port_forwards:
-            await self._collect_port_forward_metrics(client, network_id, network_name)
+            collectors.append(self._collect_port_forward_metrics(client, network_id, network_name))
 
         if self._include_reservations:
-            await self._collect_reservation_metrics(client, network_id, network_name)
+            collectors.append(self._collect_reservation_metrics(client, network_id, network_name))
 
         if self._include_blacklist:
-            await self._collect_blacklist_metrics(client, network_id, network_name)
+            collectors.append(self._collect_blacklist_metrics(client, network_id, network_name))
 
         if self._include_diagnostics:
-            await self._collect_diagnostics_metrics(client, network_id)
+            collectors.append(self._collect_diagnostics_metrics(client, network_id))
 
         if self._include_insights:
-            await self._collect_insights_metrics(client, network_id)
+            collectors.append(self._collect_insights_metrics(client, network_id))
+
+        return collectors
 
     async def _collect_eero_metrics(
         self, client: EeroClient, network_id: str, network_name: str
@@ -568,215 +1031,117 @@ class EeroCollector:
         """Collect metrics for eero devices."""
         try:
             eeros = await client.get_eeros(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="eeros", status="success").inc()
+            self._api_requests["eeros", "success"].inc()
         except EeroAPIError as e:
-            _LOGGER.warning(f"Failed to get eeros: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="eeros", status="error").inc()
+            _LOGGER.warning("Failed to get eeros: %s", e)
+            self._api_requests["eeros", "error"].inc()
             return
 
-        NETWORK_EEROS_COUNT.labels(network_id=network_id, name=network_name).set(len(eeros))
+        # Bound once; called for every gauge update below
+        set_gauge = self._set
+
+        set_gauge(NETWORK_EEROS_COUNT, (network_id, network_name), len(eeros))
 
         # Count eeros with updates available
         updates_count = sum(1 for e in eeros if e.get("update_available", False))
-        NETWORK_UPDATES_AVAILABLE.labels(network_id=network_id, name=network_name).set(
-            updates_count
-        )
+        set_gauge(NETWORK_UPDATES_AVAILABLE, (network_id, network_name), updates_count)
 
         for eero in eeros:
-            eero_url = eero.get("url", "")
-            eero_id = _extract_id_from_url(eero_url)
-            location = eero.get("location", "Unknown")
-            model = eero.get("model", "Unknown")
-            serial = eero.get("serial", "Unknown")
-            status = eero.get("status", "").lower()
-
+            get = eero.get  # bound once, read for every field below
+            eero_id = extract_id_from_url(get("url", ""))
             if not eero_id:
                 continue
 
-            os_version = eero.get("os_version") or eero.get("os") or "unknown"
+            location = get("location", "Unknown")
+            model = get("model", "Unknown")
+            os_version = get("os_version") or get("os") or "unknown"
+            status, is_online = _eero_status(eero)
 
-            EERO_INFO.labels(network_id=network_id, eero_id=eero_id, serial=serial).info(
+            # Label values shared by the per-eero metrics
+            eero_labels = (network_id, eero_id, location)
+            model_labels = (network_id, eero_id, location, model)
+
+            self._set_info(
+                EERO_INFO,
+                (network_id, eero_id, get("serial", "Unknown")),
                 {
                     "location": location,
                     "model": model,
-                    "model_number": eero.get("model_number") or "unknown",
+                    "model_number": get("model_number") or "unknown",
                     "os_version": os_version,
-                    "mac_address": eero.get("mac_address") or "unknown",
-                    "ip_address": eero.get("ip_address") or "unknown",
-                }
+                    "mac_address": get("mac_address") or "unknown",
+                    "ip_address": get("ip_address") or "unknown",
+                },
             )
 
             # Separate OS version info for easier alerting
-            EERO_OS_VERSION_INFO.labels(
-                network_id=network_id, eero_id=eero_id, location=location
-            ).info(
+            self._set_info(
+                EERO_OS_VERSION_INFO,
+                eero_labels,
                 {
                     "version": os_version,
                     "model": model,
-                }
-            )
-
-            # Check multiple possible status values indicating online state
-            # API may return: "connected", "online", "green", "up", "active", or boolean-like values
-            online_statuses = ("connected", "online", "green", "up", "active", "ok", "healthy")
-            is_online = 1 if status in online_statuses else 0
-            # If status is empty/unknown but heartbeat is ok, consider it online
-            if is_online == 0 and eero.get("heartbeat_ok", False):
-                is_online = 1
-            _LOGGER.debug(f"Eero {eero_id} status='{status}' -> is_online={is_online}")
-            EERO_STATUS.labels(
-                network_id=network_id, eero_id=eero_id, location=location, model=model
-            ).set(is_online)
-
-            is_gateway = 1 if eero.get("gateway", False) else 0
-            EERO_IS_GATEWAY.labels(network_id=network_id, eero_id=eero_id, location=location).set(
-                is_gateway
+                },
             )
 
-            clients_count = eero.get("connected_clients_count", 0)
-            EERO_CONNECTED_CLIENTS.labels(
-                network_id=network_id, eero_id=eero_id, location=location, model=model
-            ).set(clients_count)
+            _LOGGER.debug("Eero %s status='%s' -> is_online=%s", eero_id, status, is_online)
+            set_gauge(EERO_STATUS, model_labels, is_online)
 
-            wired_clients = eero.get("connected_wired_clients_count")
-            if wired_clients is not None:
-                EERO_CONNECTED_WIRED_CLIENTS.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(wired_clients)
+            is_gateway = 1 if get("gateway", False) else 0
+            set_gauge(EERO_IS_GATEWAY, eero_labels, is_gateway)
 
-            wireless_clients = eero.get("connected_wireless_clients_count")
-            if wireless_clients is not None:
-                EERO_CONNECTED_WIRELESS_CLIENTS.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(wireless_clients)
+            clients_count = get("connected_clients_count", 0)
+            set_gauge(EERO_CONNECTED_CLIENTS, model_labels, clients_count)
 
-            mesh_quality = eero.get("mesh_quality_bars")
+            mesh_quality = get("mesh_quality_bars")
             if mesh_quality is not None:
-                EERO_MESH_QUALITY.labels(
-                    network_id=network_id,
-                    eero_id=eero_id,
-                    location=location,
-                    model=model,
-                ).set(mesh_quality)
-
-            uptime = eero.get("uptime")
-            if uptime is not None:
-                EERO_UPTIME_SECONDS.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(uptime)
-
-            led_on = eero.get("led_on")
-            if led_on is not None:
-                EERO_LED_ON.labels(network_id=network_id, eero_id=eero_id, location=location).set(
-                    1 if led_on else 0
-                )
+                set_gauge(EERO_MESH_QUALITY, model_labels, mesh_quality)
 
-            update_available = eero.get("update_available")
-            if update_available is not None:
-                EERO_UPDATE_AVAILABLE.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(1 if update_available else 0)
-
-            heartbeat_ok = eero.get("heartbeat_ok")
-            if heartbeat_ok is not None:
-                EERO_HEARTBEAT_OK.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(1 if heartbeat_ok else 0)
-
-            wired = eero.get("wired")
-            if wired is not None:
-                EERO_WIRED.labels(network_id=network_id, eero_id=eero_id, location=location).set(
-                    1 if wired else 0
-                )
+            for metric, field, as_flag in _EERO_FIELD_GAUGES:
+                value = get(field)
+                if value is not None:
+                    set_gauge(metric, eero_labels, (1 if value else 0) if as_flag else value)
 
-            # Try multiple field names for memory usage
-            memory_usage = eero.get("memory_usage")
-            if memory_usage is None:
-                # Check nested structures
-                resources = eero.get("resources", {})
-                if isinstance(resources, dict):
-                    memory_usage = resources.get("memory_usage") or resources.get("memory_percent")
-                hardware = eero.get("hardware", {})
-                if isinstance(hardware, dict) and memory_usage is None:
-                    memory_usage = hardware.get("memory_usage") or hardware.get("memory_percent")
+            memory_usage = _first_resource_value(eero, "memory_usage", "memory_percent")
             if memory_usage is not None:
-                EERO_MEMORY_USAGE.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(memory_usage)
-
-            # Try multiple field names for temperature
-            temperature = eero.get("temperature")
-            if temperature is None:
-                # Check nested structures
-                resources = eero.get("resources", {})
-                if isinstance(resources, dict):
-                    temperature = resources.get("temperature") or resources.get("temp_celsius")
-                hardware = eero.get("hardware", {})
-                if isinstance(hardware, dict) and temperature is None:
-                    temperature = hardware.get("temperature") or hardware.get("temp_celsius")
-            if temperature is not None:
-                EERO_TEMPERATURE.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(temperature)
+                set_gauge(EERO_MEMORY_USAGE, eero_labels, memory_usage)
 
-            led_brightness = eero.get("led_brightness")
-            if led_brightness is not None:
-                EERO_LED_BRIGHTNESS.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(led_brightness)
+            temperature = _first_resource_value(eero, "temperature", "temp_celsius")
+            if temperature is not None:
+                set_gauge(EERO_TEMPERATURE, eero_labels, temperature)
 
-            last_reboot = eero.get("last_reboot")
+            last_reboot = get("last_reboot")
             if last_reboot:
                 reboot_ts = _parse_timestamp(last_reboot)
                 if reboot_ts is not None:
-                    EERO_LAST_REBOOT.labels(
-                        network_id=network_id, eero_id=eero_id, location=location
-                    ).set(reboot_ts)
-
-            provides_wifi = eero.get("provides_wifi")
-            if provides_wifi is not None:
-                EERO_PROVIDES_WIFI.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(1 if provides_wifi else 0)
-
-            backup_connection = eero.get("backup_connection")
-            if backup_connection is not None:
-                EERO_BACKUP_CONNECTION.labels(
-                    network_id=network_id, eero_id=eero_id, location=location
-                ).set(1 if backup_connection else 0)
+                    set_gauge(EERO_LAST_REBOOT, eero_labels, reboot_ts)
 
             if self._include_ethernet:
-                await self._collect_ethernet_port_metrics(network_id, eero_id, location, eero)
+                self._collect_ethernet_port_metrics(network_id, eero_id, location, eero)
 
-            nightlight = eero.get("nightlight", {})
+            nightlight = get("nightlight") or _EMPTY
             if nightlight and isinstance(nightlight, dict):
                 nl_enabled = nightlight.get("enabled")
                 if nl_enabled is not None:
-                    EERO_NIGHTLIGHT_ENABLED.labels(
-                        network_id=network_id, eero_id=eero_id, location=location
-                    ).set(1 if nl_enabled else 0)
+                    set_gauge(EERO_NIGHTLIGHT_ENABLED, eero_labels, 1 if nl_enabled else 0)
 
-                nl_brightness = nightlight.get("brightness") or nightlight.get(
-                    "brightness_percentage"
-                )
+                nl_brightness = _first(nightlight, "brightness", "brightness_percentage")
                 if nl_brightness is not None:
-                    EERO_NIGHTLIGHT_BRIGHTNESS.labels(
-                        network_id=network_id, eero_id=eero_id, location=location
-                    ).set(nl_brightness)
+                    set_gauge(EERO_NIGHTLIGHT_BRIGHTNESS, eero_labels, nl_brightness)
 
                 nl_ambient = nightlight.get("ambient_light_enabled")
                 if nl_ambient is not None:
-                    EERO_NIGHTLIGHT_AMBIENT_ENABLED.labels(
-                        network_id=network_id, eero_id=eero_id, location=location
-                    ).set(1 if nl_ambient else 0)
+                    set_gauge(EERO_NIGHTLIGHT_AMBIENT_ENABLED, eero_labels, 1 if nl_ambient else 0)
 
-                nl_schedule = nightlight.get("schedule", {})
+                nl_schedule = nightlight.get("schedule") or _EMPTY
                 if nl_schedule and isinstance(nl_schedule, dict):
                     schedule_enabled = nl_schedule.get("enabled")
                     if schedule_enabled is not None:
-                        EERO_NIGHTLIGHT_SCHEDULE_ENABLED.labels(
-                            network_id=network_id, eero_id=eero_id, location=location
-                        ).set(1 if schedule_enabled else 0)
+                        set_gauge(
+                            EERO_NIGHTLIGHT_SCHEDULE_ENABLED,
+                            eero_labels,
+                            1 if schedule_enabled else 0,
+                        )
 
     async def _collect_device_metrics(
         self, client: EeroClient, network_id: str, network_name: str
@@ -784,363 +1149,231 @@ class EeroCollector:
         """Collect metrics for client devices."""
         try:
             devices = await client.get_devices(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="devices", status="success").inc()
+            self._api_requests["devices", "success"].inc()
         except EeroAPIError as e:
-            _LOGGER.warning(f"Failed to get devices: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="devices", status="error").inc()
+            _LOGGER.warning("Failed to get devices: %s", e)
+            self._api_requests["devices", "error"].inc()
             return
 
-        connected_count = sum(1 for d in devices if d.get("connected", False))
-        NETWORK_CLIENTS_COUNT.labels(network_id=network_id, name=network_name).set(connected_count)
-
-        # Count guest network clients
-        guest_count = sum(
-            1 for d in devices if d.get("connected", False) and d.get("is_guest", False)
-        )
-        GUEST_NETWORK_CONNECTED_CLIENTS.labels(network_id=network_id, name=network_name).set(
-            guest_count
-        )
+        # Bound once; called for every gauge update below
+        set_gauge = self._set
 
+        connected_count = guest_count = 0
+        seen_ids: set[str] = set()
         for device in devices:
-            device_url = device.get("url", "")
-            device_id = _extract_id_from_url(device_url)
-            mac = device.get("mac", "") or device.get("eui64", "")
-            name = (
-                device.get("display_name")
-                or device.get("hostname")
-                or device.get("nickname")
-                or mac
-            )
+            get = device.get  # bound once, read for every field below
 
+            # Network-wide client counts include devices without a usable ID
+            connected = get("connected", False)
+            is_guest = get("is_guest", False)
+            if connected:
+                connected_count += 1
+                if is_guest:
+                    guest_count += 1
+
+            device_id = extract_id_from_url(get("url", ""))
             if not device_id:
                 continue
+            seen_ids.add(device_id)
+
+            connectivity = get("connectivity") or _EMPTY
 
-            # Extract enriched labels
-            manufacturer = _normalize_manufacturer(device.get("manufacturer"))
-            device_type = _normalize_device_type(device.get("device_type"))
+            # Identity and label fields, normalized once per device
+            mac = get("mac", "") or get("eui64", "")
+            name = get("display_name") or get("hostname") or get("nickname") or mac
+            manufacturer = _normalize_manufacturer(get("manufacturer"))
+            device_type = _normalize_device_type(get("device_type"))
             connection_type = _get_connection_type(device)
             source_eero = _get_source_eero_location(device)
+            band = _frequency_to_band(connectivity.get("frequency"))
 
-            # Get frequency for band label
-            connectivity = device.get("connectivity", {})
-            frequency = connectivity.get("frequency") if connectivity else None
-            band = _frequency_to_band(frequency)
+            # Label values shared by several device metrics
+            owner_labels = (network_id, device_id, name, manufacturer)
+            radio_labels = (network_id, device_id, name, manufacturer, band, source_eero)
+            rate_labels = (network_id, device_id, name, band)
+            score_labels = (network_id, device_id, name, manufacturer, connection_type, source_eero)
 
-            DEVICE_INFO.labels(network_id=network_id, device_id=device_id, mac=mac).info(
+            self._set_info(
+                DEVICE_INFO,
+                (network_id, device_id, mac),
                 {
                     "name": name,
                     "manufacturer": manufacturer,
-                    "ip": device.get("ip") or "unknown",
+                    "ip": get("ip") or "unknown",
                     "device_type": device_type,
-                    "hostname": device.get("hostname") or "unknown",
+                    "hostname": get("hostname") or "unknown",
                     "connection_type": connection_type,
                     "source_eero": source_eero,
-                }
+                },
+            )
+
+            set_gauge(
+                DEVICE_CONNECTED,
+                (
+                    network_id,
+                    device_id,
+                    name,
+                    mac,
+                    manufacturer,
+                    device_type,
+                    connection_type,
+                    source_eero,
+                ),
+                1 if connected else 0,
+            )
+
+            wireless = get("wireless", False)
+            set_gauge(
+                DEVICE_WIRELESS,
+                (network_id, device_id, name, manufacturer, device_type),
+                1 if wireless else 0,
+            )
+
+            blocked = get("blacklisted", False)
+            set_gauge(
+                DEVICE_BLOCKED,
+                (network_id, device_id, name, mac, manufacturer),
+                1 if blocked else 0,
+            )
+
+            paused = get("paused", False)
+            set_gauge(
+                DEVICE_PAUSED,
+                (network_id, device_id, name, manufacturer, device_type),
+                1 if paused else 0,
             )
 
-            connected = device.get("connected", False)
-            DEVICE_CONNECTED.labels(
-                network_id=network_id,
-                device_id=device_id,
-                name=name,
-                mac=mac,
-                manufacturer=manufacturer,
-                device_type=device_type,
-                connection_type=connection_type,
-                source_eero=source_eero,
-            ).set(1 if connected else 0)
-
-            wireless = device.get("wireless", False)
-            DEVICE_WIRELESS.labels(
-                network_id=network_id,
-                device_id=device_id,
-                name=name,
-                manufacturer=manufacturer,
-                device_type=device_type,
-            ).set(1 if wireless else 0)
-
-            blocked = device.get("blacklisted", False)
-            DEVICE_BLOCKED.labels(
-                network_id=network_id,
-                device_id=device_id,
-                name=name,
-                mac=mac,
-                manufacturer=manufacturer,
-            ).set(1 if blocked else 0)
-
-            paused = device.get("paused", False)
-            DEVICE_PAUSED.labels(
-                network_id=network_id,
-                device_id=device_id,
-                name=name,
-                manufacturer=manufacturer,
-                device_type=device_type,
-            ).set(1 if paused else 0)
-
-            is_guest = device.get("is_guest", False)
-            DEVICE_IS_GUEST.labels(
-                network_id=network_id,
-                device_id=device_id,
-                name=name,
-                manufacturer=manufacturer,
-            ).set(1 if is_guest else 0)
+            set_gauge(DEVICE_IS_GUEST, owner_labels, 1 if is_guest else 0)
 
             if connectivity:
                 signal = _parse_signal_strength(connectivity.get("signal"))
                 if signal is not None:
-                    DEVICE_SIGNAL_STRENGTH.labels(
-                        network_id=network_id,
-                        device_id=device_id,
-                        name=name,
-                        manufacturer=manufacturer,
-                        band=band,
-                        source_eero=source_eero,
-                    ).set(signal)
+                    set_gauge(DEVICE_SIGNAL_STRENGTH, radio_labels, signal)
 
                 signal_avg = _parse_signal_strength(connectivity.get("signal_avg"))
                 if signal_avg is not None:
-                    DEVICE_SIGNAL_AVG.labels(
-                        network_id=network_id,
-                        device_id=device_id,
-                        name=name,
-                        manufacturer=manufacturer,
-                        band=band,
-                        source_eero=source_eero,
-                    ).set(signal_avg)
+                    set_gauge(DEVICE_SIGNAL_AVG, radio_labels, signal_avg)
 
                 score = connectivity.get("score")
                 if score is not None:
-                    DEVICE_CONNECTION_SCORE.labels(
-                        network_id=network_id,
-                        device_id=device_id,
-                        name=name,
-                        manufacturer=manufacturer,
-                        connection_type=connection_type,
-                        source_eero=source_eero,
-                    ).set(score)
+                    set_gauge(DEVICE_CONNECTION_SCORE, score_labels, score)
 
                 score_bars = connectivity.get("score_bars")
                 if score_bars is not None:
-                    DEVICE_CONNECTION_SCORE_BARS.labels(
-                        network_id=network_id,
-                        device_id=device_id,
-                        name=name,
-                        manufacturer=manufacturer,
-                        connection_type=connection_type,
-                        source_eero=source_eero,
-                    ).set(score_bars)
+                    set_gauge(DEVICE_CONNECTION_SCORE_BARS, score_labels, score_bars)
 
+                frequency = connectivity.get("frequency")
                 if frequency is not None:
-                    DEVICE_FREQUENCY.labels(
-                        network_id=network_id,
-                        device_id=device_id,
-                        name=name,
-                        manufacturer=manufacturer,
-                        band=band,
-                        source_eero=source_eero,
-                    ).set(frequency)
+                    set_gauge(DEVICE_FREQUENCY, radio_labels, frequency)
 
                 rx_bitrate = _parse_bitrate(connectivity.get("rx_bitrate"))
                 if rx_bitrate is not None:
-                    DEVICE_RX_BITRATE.labels(
-                        network_id=network_id,
-                        device_id=device_id,
-                        name=name,
-                        manufacturer=manufacturer,
-                        band=band,
-                        source_eero=source_eero,
-                    ).set(rx_bitrate)
-
-                rx_rate_info = connectivity.get("rx_rate_info", {})
+                    set_gauge(DEVICE_RX_BITRATE, radio_labels, rx_bitrate)
+
+                rx_rate_info = connectivity.get("rx_rate_info") or _EMPTY
                 if rx_rate_info and isinstance(rx_rate_info, dict):
-                    rx_mcs = rx_rate_info.get("mcs")
-                    if rx_mcs is not None:
-                        DEVICE_RX_MCS.labels(
-                            network_id=network_id,
-                            device_id=device_id,
-                            name=name,
-                            band=band,
-                        ).set(rx_mcs)
-
-                    rx_nss = rx_rate_info.get("nss")
-                    if rx_nss is not None:
-                        DEVICE_RX_NSS.labels(
-                            network_id=network_id,
-                            device_id=device_id,
-                            name=name,
-                            band=band,
-                        ).set(rx_nss)
-
-                    rx_bw = rx_rate_info.get("bandwidth")
-                    if rx_bw is not None:
-                        DEVICE_RX_BANDWIDTH.labels(
-                            network_id=network_id,
-                            device_id=device_id,
-                            name=name,
-                            band=band,
-                        ).set(rx_bw)
+                    for metric, field in _RX_RATE_GAUGES:
+                        value = rx_rate_info.get(field)
+                        if value is not None:
+                            set_gauge(metric, rate_labels, value)
 
                     if rx_bitrate is None:
                         rx_rate_bitrate = rx_rate_info.get("bitrate")
                         if rx_rate_bitrate is not None:
-                            DEVICE_RX_BITRATE.labels(
-                                network_id=network_id,
-                                device_id=device_id,
-                                name=name,
-                                manufacturer=manufacturer,
-                                band=band,
-                                source_eero=source_eero,
-                            ).set(rx_rate_bitrate)
-
-                tx_rate_info = connectivity.get("tx_rate_info", {})
+                            set_gauge(DEVICE_RX_BITRATE, radio_labels, rx_rate_bitrate)
+
+                tx_rate_info = connectivity.get("tx_rate_info") or _EMPTY
                 if tx_rate_info and isinstance(tx_rate_info, dict):
-                    tx_mcs = tx_rate_info.get("mcs")
-                    if tx_mcs is not None:
-                        DEVICE_TX_MCS.labels(
-                            network_id=network_id,
-                            device_id=device_id,
-                            name=name,
-                            band=band,
-                        ).set(tx_mcs)
-
-                    tx_nss = tx_rate_info.get("nss")
-                    if tx_nss is not None:
-                        DEVICE_TX_NSS.labels(
-                            network_id=network_id,
-                            device_id=device_id,
-                            name=name,
-                            band=band,
-                        ).set(tx_nss)
-
-                    tx_bw = tx_rate_info.get("bandwidth")
-                    if tx_bw is not None:
-                        DEVICE_TX_BANDWIDTH.labels(
-                            network_id=network_id,
-                            device_id=device_id,
-                            name=name,
-                            band=band,
-                        ).set(tx_bw)
+                    for metric, field in _TX_RATE_GAUGES:
+                        value = tx_rate_info.get(field)
+                        if value is not None:
+                            set_gauge(metric, rate_labels, value)
 
                     tx_bitrate = tx_rate_info.get("bitrate")
                     if tx_bitrate is not None:
-                        DEVICE_TX_BITRATE.labels(
-                            network_id=network_id,
-                            device_id=device_id,
-                            name=name,
-                            manufacturer=manufacturer,
-                            band=band,
-                            source_eero=source_eero,
-                        ).set(tx_bitrate)
-
-            channel = device.get("channel")
+                        set_gauge(DEVICE_TX_BITRATE, radio_labels, tx_bitrate)
+
+            channel = get("channel")
             if channel is not None:
-                DEVICE_CHANNEL.labels(
-                    network_id=network_id,
-                    device_id=device_id,
-                    name=name,
-                    band=band,
-                    source_eero=source_eero,
-                ).set(channel)
-
-            prioritized = device.get("prioritized") or device.get("priority")
+                set_gauge(DEVICE_CHANNEL, (network_id, device_id, name, band, source_eero), channel)
+
+            prioritized = get("prioritized") or get("priority")
             if prioritized is not None:
-                DEVICE_PRIORITIZED.labels(
-                    network_id=network_id,
-                    device_id=device_id,
-                    name=name,
-                    manufacturer=manufacturer,
-                    device_type=device_type,
-                ).set(1 if prioritized else 0)
-
-            is_private = device.get("is_private")
+                set_gauge(
+                    DEVICE_PRIORITIZED,
+                    (network_id, device_id, name, manufacturer, device_type),
+                    1 if prioritized else 0,
+                )
+
+            is_private = get("is_private")
             if is_private is not None:
-                DEVICE_PRIVATE.labels(
-                    network_id=network_id,
-                    device_id=device_id,
-                    name=name,
-                    manufacturer=manufacturer,
-                ).set(1 if is_private else 0)
-
-            source = device.get("source", {})
+                set_gauge(DEVICE_PRIVATE, owner_labels, 1 if is_private else 0)
+
+            source = get("source") or _EMPTY
             if source and isinstance(source, dict):
                 source_is_gateway = source.get("is_gateway")
                 if source_is_gateway is not None:
-                    DEVICE_CONNECTED_TO_GATEWAY.labels(
-                        network_id=network_id,
-                        device_id=device_id,
-                        name=name,
-                        connection_type=connection_type,
-                    ).set(1 if source_is_gateway else 0)
+                    set_gauge(
+                        DEVICE_CONNECTED_TO_GATEWAY,
+                        (network_id, device_id, name, connection_type),
+                        1 if source_is_gateway else 0,
+                    )
 
             # Extended device metrics
-            last_active = device.get("last_active")
+            last_active = get("last_active")
             if last_active:
                 last_active_ts = _parse_timestamp(last_active)
                 if last_active_ts is not None:
-                    DEVICE_LAST_ACTIVE_TIMESTAMP.labels(
-                        network_id=network_id,
-                        device_id=device_id,
-                        name=name,
-                        manufacturer=manufacturer,
-                    ).set(last_active_ts)
-
-            first_seen = device.get("first_active") or device.get("first_seen")
+                    set_gauge(DEVICE_LAST_ACTIVE_TIMESTAMP, owner_labels, last_active_ts)
+
+            first_seen = get("first_active") or get("first_seen")
             if first_seen:
                 first_seen_ts = _parse_timestamp(first_seen)
                 if first_seen_ts is not None:
-                    DEVICE_FIRST_SEEN_TIMESTAMP.labels(
-                        network_id=network_id,
-                        device_id=device_id,
-                        name=name,
-                        manufacturer=manufacturer,
-                    ).set(first_seen_ts)
+                    set_gauge(DEVICE_FIRST_SEEN_TIMESTAMP, owner_labels, first_seen_ts)
 
             # WiFi generation
             wifi_gen = _get_wifi_generation(device)
             if wifi_gen is not None:
-                DEVICE_WIFI_GENERATION.labels(
-                    network_id=network_id,
-                    device_id=device_id,
-                    name=name,
-                    manufacturer=manufacturer,
-                ).set(wifi_gen)
+                set_gauge(DEVICE_WIFI_GENERATION, owner_labels, wifi_gen)
 
             # Ad blocking per device
-            adblock_enabled = device.get("ad_block") or device.get("ad_blocking")
+            adblock_enabled = get("ad_block") or get("ad_blocking")
             if adblock_enabled is not None:
-                DEVICE_ADBLOCK_ENABLED.labels(
-                    network_id=network_id,
-                    device_id=device_id,
-                    name=name,
-                    manufacturer=manufacturer,
-                ).set(1 if adblock_enabled else 0)
+                set_gauge(DEVICE_ADBLOCK_ENABLED, owner_labels, 1 if adblock_enabled else 0)
+
+        set_gauge(NETWORK_CLIENTS_COUNT, (network_id, network_name), connected_count)
+        set_gauge(GUEST_NETWORK_CONNECTED_CLIENTS, (network_id, network_name), guest_count)
+
+        departed = self._device_ids.get(network_id, set()) - seen_ids
+        self._device_ids[network_id] = seen_ids
+        if departed:
+            self._remove_device_children(network_id, departed)
 
     async def _collect_profile_metrics(self, client: EeroClient, network_id: str) -> None:
         """Collect metrics for profiles."""
         try:
             profiles = await client.get_profiles(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="profiles", status="success").inc()
+            self._api_requests["profiles", "success"].inc()
         except EeroAPIError as e:
-            _LOGGER.warning(f"Failed to get profiles: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="profiles", status="error").inc()
+            _LOGGER.warning("Failed to get profiles: %s", e)
+            self._api_requests["profiles", "error"].inc()
             return
 
         for profile in profiles:
             if not isinstance(profile, dict):
-                _LOGGER.warning(f"Unexpected profile format: {type(profile)}")
+                _LOGGER.warning("Unexpected profile format: %s", type(profile))
                 continue
 
             profile_url = profile.get("url", "")
-            profile_id = _extract_id_from_url(profile_url)
+            profile_id = extract_id_from_url(profile_url)
             name = profile.get("name", "Unknown")
 
             if not profile_id:
                 continue
 
             paused = profile.get("paused", False)
-            PROFILE_PAUSED.labels(network_id=network_id, profile_id=profile_id, name=name).set(
-                1 if paused else 0
-            )
+            self._set(PROFILE_PAUSED, (network_id, profile_id, name), 1 if paused else 0)
 
             devices_data = profile.get("devices", [])
             if isinstance(devices_data, dict):
@@ -1149,9 +1382,7 @@ class EeroCollector:
                 devices = devices_data
             else:
                 devices = []
-            PROFILE_DEVICES_COUNT.labels(
-                network_id=network_id, profile_id=profile_id, name=name
-            ).set(len(devices))
+            self._set(PROFILE_DEVICES_COUNT, (network_id, profile_id, name), len(devices))
 
     async def _collect_network_feature_flags(
         self,
@@ -1161,171 +1392,134 @@ class EeroCollector:
         network_details: dict[str, Any],
     ) -> None:
         """Collect network feature flag metrics."""
-        wpa3 = network_details.get("wpa3")
-        if wpa3 is not None:
-            NETWORK_WPA3_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if wpa3 else 0
-            )
-
-        band_steering = network_details.get("band_steering")
-        if band_steering is not None:
-            NETWORK_BAND_STEERING_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if band_steering else 0
-            )
-
-        sqm = network_details.get("sqm")
-        if sqm is not None:
-            NETWORK_SQM_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if sqm else 0
-            )
-
-        upnp = network_details.get("upnp")
-        if upnp is not None:
-            NETWORK_UPNP_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if upnp else 0
-            )
-
-        thread = network_details.get("thread")
-        if thread is not None:
-            NETWORK_THREAD_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if thread else 0
-            )
+        # Bound once; called for every gauge update below
+        set_gauge = self._set
+        network_labels = (network_id, network_name)
 
-        ipv6_upstream = network_details.get("ipv6_upstream")
-        if ipv6_upstream is not None:
-            NETWORK_IPV6_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if ipv6_upstream else 0
-            )
+        for metric, field in _NETWORK_FLAG_GAUGES:
+            value = network_details.get(field)
+            if value is not None:
+                set_gauge(metric, network_labels, 1 if value else 0)
 
         dns_caching = network_details.get("dns_caching")
-        settings = network_details.get("settings", {})
+        settings = network_details.get("settings") or _EMPTY
         if dns_caching is None and isinstance(settings, dict):
             dns_caching = settings.get("dns_caching")
         if dns_caching is not None:
-            NETWORK_DNS_CACHING_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if dns_caching else 0
-            )
-
-        power_saving = network_details.get("power_saving")
-        if power_saving is not None:
-            NETWORK_POWER_SAVING_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if power_saving else 0
-            )
+            set_gauge(NETWORK_DNS_CACHING_ENABLED, network_labels, 1 if dns_caching else 0)
 
         # Try multiple field names for guest network enabled
         guest_enabled = network_details.get("guest_network_enabled")
         if guest_enabled is None:
             # Check nested guest_network object
-            guest_net = network_details.get("guest_network", {})
+            guest_net = network_details.get("guest_network") or _EMPTY
             if isinstance(guest_net, dict):
                 guest_enabled = guest_net.get("enabled")
         if guest_enabled is not None:
-            NETWORK_GUEST_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if guest_enabled else 0
-            )
+            set_gauge(NETWORK_GUEST_ENABLED, network_labels, 1 if guest_enabled else 0)
         else:
             # Default to 0 if not found to avoid "No data" in dashboard
-            NETWORK_GUEST_ENABLED.labels(network_id=network_id, name=network_name).set(0)
-
-        backup_enabled = network_details.get("backup_internet_enabled")
-        if backup_enabled is not None:
-            NETWORK_BACKUP_INTERNET_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if backup_enabled else 0
-            )
+            set_gauge(NETWORK_GUEST_ENABLED, network_labels, 0)
 
         # Guest network metrics
-        guest_network = network_details.get("guest_network", {})
+        guest_network = network_details.get("guest_network") or _EMPTY
         if guest_network and isinstance(guest_network, dict):
             guest_name = guest_network.get("name", "")
-            GUEST_NETWORK_INFO.labels(network_id=network_id).info(
+            self._set_info(
+                GUEST_NETWORK_INFO,
+                (network_id,),
                 {
                     "name": guest_name or "Guest Network",
                     "enabled": str(network_details.get("guest_network_enabled", False)).lower(),
-                }
+                },
             )
 
             access_duration = guest_network.get("access_duration_enabled")
             if access_duration is not None:
-                GUEST_NETWORK_ACCESS_DURATION_ENABLED.labels(
-                    network_id=network_id, name=network_name
-                ).set(1 if access_duration else 0)
+                set_gauge(
+                    GUEST_NETWORK_ACCESS_DURATION_ENABLED,
+                    network_labels,
+                    1 if access_duration else 0,
+                )
 
         # DNS configuration metrics
         custom_dns = network_details.get("custom_dns", [])
         dns_caching = network_details.get("dns_caching", False)
 
         if custom_dns and isinstance(custom_dns, list):
-            NETWORK_CUSTOM_DNS_ENABLED.labels(network_id=network_id, name=network_name).set(1)
-            NETWORK_DNS_SERVER_COUNT.labels(network_id=network_id, name=network_name).set(
-                len(custom_dns)
-            )
-            DNS_CONFIG_INFO.labels(network_id=network_id).info(
+            set_gauge(NETWORK_CUSTOM_DNS_ENABLED, network_labels, 1)
+            set_gauge(NETWORK_DNS_SERVER_COUNT, network_labels, len(custom_dns))
+            self._set_info(
+                DNS_CONFIG_INFO,
+                (network_id,),
                 {
                     "mode": "custom",
                     "primary_dns": custom_dns[0] if custom_dns else "auto",
                     "secondary_dns": custom_dns[1] if len(custom_dns) > 1 else "",
                     "caching_enabled": str(dns_caching).lower(),
-                }
+                },
             )
         else:
-            NETWORK_CUSTOM_DNS_ENABLED.labels(network_id=network_id, name=network_name).set(0)
-            NETWORK_DNS_SERVER_COUNT.labels(network_id=network_id, name=network_name).set(0)
-            DNS_CONFIG_INFO.labels(network_id=network_id).info(
+            set_gauge(NETWORK_CUSTOM_DNS_ENABLED, network_labels, 0)
+            set_gauge(NETWORK_DNS_SERVER_COUNT, network_labels, 0)
+            self._set_info(
+                DNS_CONFIG_INFO,
+                (network_id,),
                 {
                     "mode": "auto",
                     "primary_dns": "auto",
                     "secondary_dns": "",
                     "caching_enabled": str(dns_caching).lower(),
-                }
+                },
             )
 
         # Ad blocking metrics (network-wide)
-        ad_block = network_details.get("ad_block") or network_details.get("ad_blocking")
+        ad_block = _first(network_details, "ad_block", "ad_blocking")
         if ad_block is not None:
-            NETWORK_AD_BLOCK_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if ad_block else 0
-            )
+            set_gauge(NETWORK_AD_BLOCK_ENABLED, network_labels, 1 if ad_block else 0)
 
         # Auto-update setting
-        auto_update = network_details.get("auto_update") or network_details.get(
-            "auto_update_enabled"
-        )
+        auto_update = _first(network_details, "auto_update", "auto_update_enabled")
         if auto_update is not None:
-            NETWORK_AUTO_UPDATE_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if auto_update else 0
-            )
+            set_gauge(NETWORK_AUTO_UPDATE_ENABLED, network_labels, 1 if auto_update else 0)
 
     async def _collect_sqm_metrics(self, client: EeroClient, network_id: str) -> None:
         """Collect SQM (Smart Queue Management) metrics."""
         try:
             sqm_settings = await client.get_sqm_settings(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="sqm", status="success").inc()
+            self._api_requests["sqm", "cached" if served_from_cache() else "success"].inc()
 
             upload_bw = sqm_settings.get("upload_bandwidth")
             if upload_bw is not None:
-                SQM_UPLOAD_BANDWIDTH.labels(network_id=network_id).set(upload_bw)
+                self._set(SQM_UPLOAD_BANDWIDTH, (network_id,), upload_bw)
 
             download_bw = sqm_settings.get("download_bandwidth")
             if download_bw is not None:
-                SQM_DOWNLOAD_BANDWIDTH.labels(network_id=network_id).set(download_bw)
+                self._set(SQM_DOWNLOAD_BANDWIDTH, (network_id,), download_bw)
 
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get SQM settings: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="sqm", status="error").inc()
+            _LOGGER.debug("Failed to get SQM settings: %s", e)
+            self._api_requests["sqm", "error"].inc()
 
-    async def _collect_ethernet_port_metrics(
+    def _collect_ethernet_port_metrics(
         self, network_id: str, eero_id: str, location: str, eero: dict[str, Any]
     ) -> None:
-        """Collect ethernet port metrics for an eero device."""
-        ethernet_status = eero.get("ethernet_status", {})
+        """Collect ethernet port metrics for an eero device.
+
+        Ports are read from the eero entry itself, so no request is made.
+        """
+        ethernet_status = eero.get("ethernet_status") or _EMPTY
         if not ethernet_status:
             return
 
+        # Bound once; called for every gauge update below
+        set_gauge = self._set
+
         wired_internet = ethernet_status.get("wiredInternet")
         if wired_internet is not None:
-            EERO_WIRED_INTERNET.labels(
-                network_id=network_id, eero_id=eero_id, location=location
-            ).set(1 if wired_internet else 0)
+            set_gauge(
+                EERO_WIRED_INTERNET, (network_id, eero_id, location), 1 if wired_internet else 0
+            )
 
         statuses = ethernet_status.get("statuses", [])
         if not statuses or not isinstance(statuses, list):
@@ -1336,58 +1530,38 @@ class EeroCollector:
                 continue
 
             port_num = port_status.get("interfaceNumber", 0)
-            port_name = port_status.get("port_name", f"port{port_num}")
+            port_name = port_status.get("port_name") or f"port{port_num}"
             port_num_str = str(port_num)
 
-            ETHERNET_PORT_INFO.labels(
-                network_id=network_id, eero_id=eero_id, port_number=port_num_str
-            ).info(
+            self._set_info(
+                ETHERNET_PORT_INFO,
+                (network_id, eero_id, port_num_str),
                 {
                     "port_name": port_name,
                     "original_speed": port_status.get("original_speed") or "unknown",
                     "derated_reason": port_status.get("derated_reason") or "none",
-                }
+                },
             )
 
+            # Port name and eero location live on the Info metrics only, so a
+            # rename does not start a new series for every port gauge
+            port_labels = (network_id, eero_id, port_num_str)
+
             has_carrier = port_status.get("hasCarrier")
             if has_carrier is not None:
-                ETHERNET_PORT_CARRIER.labels(
-                    network_id=network_id,
-                    eero_id=eero_id,
-                    location=location,
-                    port_number=port_num_str,
-                    port_name=port_name,
-                ).set(1 if has_carrier else 0)
+                set_gauge(ETHERNET_PORT_CARRIER, port_labels, 1 if has_carrier else 0)
 
             speed = _parse_speed_mbps(port_status.get("speed"))
             if speed is not None:
-                ETHERNET_PORT_SPEED.labels(
-                    network_id=network_id,
-                    eero_id=eero_id,
-                    location=location,
-                    port_number=port_num_str,
-                    port_name=port_name,
-                ).set(speed)
+                set_gauge(ETHERNET_PORT_SPEED, port_labels, speed)
 
             is_wan = port_status.get("isWanPort")
             if is_wan is not None:
-                ETHERNET_PORT_IS_WAN.labels(
-                    network_id=network_id,
-                    eero_id=eero_id,
-                    location=location,
-                    port_number=port_num_str,
-                    port_name=port_name,
-                ).set(1 if is_wan else 0)
+                set_gauge(ETHERNET_PORT_IS_WAN, port_labels, 1 if is_wan else 0)
 
             power_saving = port_status.get("power_saving")
             if power_saving is not None:
-                ETHERNET_PORT_POWER_SAVING.labels(
-                    network_id=network_id,
-                    eero_id=eero_id,
-                    location=location,
-                    port_number=port_num_str,
-                    port_name=port_name,
-                ).set(1 if power_saving else 0)
+                set_gauge(ETHERNET_PORT_POWER_SAVING, port_labels, 1 if power_saving else 0)
 
     async def _collect_premium_metrics(
         self, client: EeroClient, network_id: str, network_name: str
@@ -1395,44 +1569,61 @@ class EeroCollector:
         """Collect premium features metrics (Eero Plus)."""
         try:
             is_premium = await client.is_premium(network_id)
+            cached = served_from_cache()
             self._is_premium = is_premium
-            NETWORK_PREMIUM_ENABLED.labels(network_id=network_id, name=network_name).set(
-                1 if is_premium else 0
-            )
-            EXPORTER_API_REQUESTS.labels(endpoint="premium", status="success").inc()
+            self._set(NETWORK_PREMIUM_ENABLED, (network_id, network_name), 1 if is_premium else 0)
+            self._api_requests["premium", "cached" if cached else "success"].inc()
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get premium status: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="premium", status="error").inc()
+            _LOGGER.debug("Failed to get premium status: %s", e)
+            self._api_requests["premium", "error"].inc()
             return
 
         if not self._is_premium:
             return
 
-        await self._collect_activity_metrics(client, network_id)
-        await self._collect_backup_metrics(client, network_id)
+        # Activity and backup hit separate endpoints, so fetch them concurrently
+        results = await asyncio.gather(
+            self._collect_activity_metrics(client, network_id),
+            self._collect_backup_metrics(client, network_id),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def _collect_activity_metrics(self, client: EeroClient, network_id: str) -> None:
         """Collect activity metrics (Eero Plus feature)."""
+        results = await asyncio.gather(
+            self._collect_activity_usage(client, network_id),
+            self._collect_activity_categories(client, network_id),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _collect_activity_usage(self, client: EeroClient, network_id: str) -> None:
+        """Collect network and per-client usage from the activity endpoint."""
         try:
             activity = await client.get_activity(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="activity", status="success").inc()
+            self._api_requests["activity", "success"].inc()
 
             if not activity:
                 return
 
-            total_usage = activity.get("total_usage", {})
+            total_usage = activity.get("total_usage") or _EMPTY
             if total_usage:
-                download = total_usage.get("download") or total_usage.get("download_bytes", 0)
-                if download:
-                    ACTIVITY_DOWNLOAD_BYTES.labels(network_id=network_id).set(download)
+                download = _first(total_usage, "download", "download_bytes", default=0)
+                if download is not None:
+                    self._set(ACTIVITY_DOWNLOAD_BYTES, (network_id,), download)
 
-                upload = total_usage.get("upload") or total_usage.get("upload_bytes", 0)
-                if upload:
-                    ACTIVITY_UPLOAD_BYTES.labels(network_id=network_id).set(upload)
+                upload = _first(total_usage, "upload", "upload_bytes", default=0)
+                if upload is not None:
+                    self._set(ACTIVITY_UPLOAD_BYTES, (network_id,), upload)
 
             active_clients = activity.get("active_client_count")
             if active_clients is not None:
-                ACTIVITY_ACTIVE_CLIENTS.labels(network_id=network_id).set(active_clients)
+                self._set(ACTIVITY_ACTIVE_CLIENTS, (network_id,), active_clients)
 
             top_clients = activity.get("top_clients", [])
             for client_act in top_clients:
@@ -1442,119 +1633,95 @@ class EeroCollector:
                 device_id = client_act.get("device_id", "")
                 if not device_id:
                     url = client_act.get("url", "")
-                    device_id = _extract_id_from_url(url)
-
-                name = (
-                    client_act.get("nickname")
-                    or client_act.get("display_name")
-                    or client_act.get("hostname")
-                    or device_id
-                )
+                    device_id = extract_id_from_url(url)
 
                 # Extract additional labels from activity data
                 manufacturer = _normalize_manufacturer(client_act.get("manufacturer"))
                 device_type = _normalize_device_type(client_act.get("device_type"))
 
-                usage = client_act.get("usage", {})
+                usage = client_act.get("usage") or _EMPTY
                 if usage and isinstance(usage, dict):
-                    dl = usage.get("download_bytes", 0)
-                    if dl:
-                        DEVICE_ACTIVITY_DOWNLOAD_BYTES.labels(
-                            network_id=network_id,
-                            device_id=device_id,
-                            name=name,
-                            manufacturer=manufacturer,
-                            device_type=device_type,
-                        ).set(dl)
-                    ul = usage.get("upload_bytes", 0)
-                    if ul:
-                        DEVICE_ACTIVITY_UPLOAD_BYTES.labels(
-                            network_id=network_id,
-                            device_id=device_id,
-                            name=name,
-                            manufacturer=manufacturer,
-                            device_type=device_type,
-                        ).set(ul)
+                    client_labels = (network_id, device_id, manufacturer, device_type)
+                    dl = usage.get("download_bytes")
+                    if dl is not None:
+                        self._set(DEVICE_ACTIVITY_DOWNLOAD_BYTES, client_labels, dl)
+                    ul = usage.get("upload_bytes")
+                    if ul is not None:
+                        self._set(DEVICE_ACTIVITY_UPLOAD_BYTES, client_labels, ul)
 
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get activity: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="activity", status="error").inc()
+            _LOGGER.debug("Failed to get activity: %s", e)
+            self._api_requests["activity", "error"].inc()
 
+    async def _collect_activity_categories(self, client: EeroClient, network_id: str) -> None:
+        """Collect per-category usage from the activity categories endpoint."""
         try:
             categories = await client.get_activity_categories(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="activity_categories", status="success").inc()
+            self._api_requests["activity_categories", "success"].inc()
 
             for category in categories:
                 if not isinstance(category, dict):
                     continue
                 cat_name = category.get("name", "unknown")
-                usage = category.get("usage", {})
+                usage = category.get("usage") or _EMPTY
                 if usage and isinstance(usage, dict):
-                    total = usage.get("total_bytes") or usage.get("total", 0)
-                    if total:
-                        ACTIVITY_CATEGORY_BYTES.labels(
-                            network_id=network_id, category=cat_name
-                        ).set(total)
+                    total = _first(usage, "total_bytes", "total")
+                    if total is not None:
+                        self._set(ACTIVITY_CATEGORY_BYTES, (network_id, cat_name), total)
 
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get activity categories: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="activity_categories", status="error").inc()
+            _LOGGER.debug("Failed to get activity categories: %s", e)
+            self._api_requests["activity_categories", "error"].inc()
 
     async def _collect_backup_metrics(self, client: EeroClient, network_id: str) -> None:
         """Collect backup network metrics (Eero Plus feature)."""
         try:
             backup_config = await client.get_backup_network(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="backup", status="success").inc()
-
-            enabled = backup_config.get("enabled")
-            if enabled is not None:
-                BACKUP_ENABLED.labels(network_id=network_id).set(1 if enabled else 0)
-
+            self._api_requests["backup", "cached" if served_from_cache() else "success"].inc()
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get backup config: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="backup", status="error").inc()
+            _LOGGER.debug("Failed to get backup config: %s", e)
+            self._api_requests["backup", "error"].inc()
             return
 
+        enabled = backup_config.get("enabled")
+        if enabled is not None:
+            self._set(BACKUP_ENABLED, (network_id,), 1 if enabled else 0)
+
         try:
             backup_status = await client.get_backup_status(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="backup_status", status="success").inc()
-
-            active = backup_status.get("active") or backup_status.get("using_backup")
-            if active is not None:
-                BACKUP_ACTIVE.labels(network_id=network_id).set(1 if active else 0)
-
-            connected = backup_status.get("connected")
-            if connected is not None:
-                BACKUP_CONNECTED.labels(network_id=network_id).set(1 if connected else 0)
-
-            signal = backup_status.get("signal_strength")
-            if signal is not None:
-                BACKUP_SIGNAL_STRENGTH.labels(network_id=network_id).set(signal)
-
+            self._api_requests["backup_status", "success"].inc()
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get backup status: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="backup_status", status="error").inc()
+            _LOGGER.debug("Failed to get backup status: %s", e)
+            self._api_requests["backup_status", "error"].inc()
+            return
+
+        # (gauge, value, export as 0/1)
+        status_values = (
+            (BACKUP_ACTIVE, _first(backup_status, "active", "using_backup"), True),
+            (BACKUP_CONNECTED, backup_status.get("connected"), True),
+            (BACKUP_SIGNAL_STRENGTH, backup_status.get("signal_strength"), False),
+        )
+        for metric, value, as_flag in status_values:
+            if value is not None:
+                self._set(metric, (network_id,), (1 if value else 0) if as_flag else value)
 
     async def _collect_thread_metrics(self, client: EeroClient, network_id: str) -> None:
         """Collect Thread network metrics."""
         try:
             thread_data = await client.get_thread(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="thread", status="success").inc()
+            self._api_requests["thread", "success"].inc()
 
             if not thread_data:
                 return
 
-            devices = thread_data.get("devices", [])
-            if isinstance(devices, list):
-                THREAD_DEVICE_COUNT.labels(network_id=network_id).set(len(devices))
-
-            border_routers = thread_data.get("border_routers", [])
-            if isinstance(border_routers, list):
-                THREAD_BORDER_ROUTER.labels(network_id=network_id).set(len(border_routers))
+            for metric, field in _THREAD_COUNT_GAUGES:
+                items = thread_data.get(field, [])
+                if isinstance(items, list):
+                    self._set(metric, (network_id,), len(items))
 
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get Thread data: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="thread", status="error").inc()
+            _LOGGER.debug("Failed to get Thread data: %s", e)
+            self._api_requests["thread", "error"].inc()
 
     async def _collect_port_forward_metrics(
         self, client: EeroClient, network_id: str, network_name: str
@@ -1562,43 +1729,42 @@ class EeroCollector:
         """Collect port forwarding metrics."""
         try:
             forwards = await client.get_forwards(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="forwards", status="success").inc()
+            self._api_requests["forwards", "success"].inc()
 
-            NETWORK_PORT_FORWARDS_COUNT.labels(network_id=network_id, name=network_name).set(
-                len(forwards)
-            )
+            self._set(NETWORK_PORT_FORWARDS_COUNT, (network_id, network_name), len(forwards))
 
             for forward in forwards:
                 if not isinstance(forward, dict):
                     continue
 
                 forward_url = forward.get("url", "")
-                forward_id = _extract_id_from_url(forward_url) or str(hash(str(forward)))[:8]
+                forward_id = extract_id_from_url(forward_url) or str(hash(str(forward)))[:8]
 
                 port = str(forward.get("port", forward.get("external_port", "")))
                 protocol = forward.get("protocol", "tcp").lower()
                 enabled = forward.get("enabled", True)
 
-                PORT_FORWARD_INFO.labels(network_id=network_id, forward_id=forward_id).info(
+                self._set_info(
+                    PORT_FORWARD_INFO,
+                    (network_id, forward_id),
                     {
                         "port": port,
                         "internal_port": str(forward.get("internal_port", port)),
                         "protocol": protocol,
                         "ip_address": forward.get("ip_address", ""),
                         "nickname": forward.get("nickname", ""),
-                    }
+                    },
                 )
 
-                PORT_FORWARD_ENABLED.labels(
-                    network_id=network_id,
-                    forward_id=forward_id,
-                    port=port,
-                    protocol=protocol,
-                ).set(1 if enabled else 0)
+                self._set(
+                    PORT_FORWARD_ENABLED,
+                    (network_id, forward_id, port, protocol),
+                    1 if enabled else 0,
+                )
 
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get port forwards: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="forwards", status="error").inc()
+            _LOGGER.debug("Failed to get port forwards: %s", e)
+            self._api_requests["forwards", "error"].inc()
 
     async def _collect_reservation_metrics(
         self, client: EeroClient, network_id: str, network_name: str
@@ -1606,15 +1772,15 @@ class EeroCollector:
         """Collect DHCP reservation metrics."""
         try:
             reservations = await client.get_reservations(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="reservations", status="success").inc()
+            self._api_requests["reservations", "success"].inc()
 
-            NETWORK_DHCP_RESERVATIONS_COUNT.labels(network_id=network_id, name=network_name).set(
-                len(reservations)
+            self._set(
+                NETWORK_DHCP_RESERVATIONS_COUNT, (network_id, network_name), len(reservations)
             )
 
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get DHCP reservations: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="reservations", status="error").inc()
+            _LOGGER.debug("Failed to get DHCP reservations: %s", e)
+            self._api_requests["reservations", "error"].inc()
 
     async def _collect_blacklist_metrics(
         self, client: EeroClient, network_id: str, network_name: str
@@ -1622,27 +1788,25 @@ class EeroCollector:
         """Collect blacklist metrics."""
         try:
             blacklist = await client.get_blacklist(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="blacklist", status="success").inc()
+            self._api_requests["blacklist", "success"].inc()
 
-            NETWORK_BLACKLISTED_DEVICES_COUNT.labels(network_id=network_id, name=network_name).set(
-                len(blacklist)
-            )
+            self._set(NETWORK_BLACKLISTED_DEVICES_COUNT, (network_id, network_name), len(blacklist))
 
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get blacklist: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="blacklist", status="error").inc()
+            _LOGGER.debug("Failed to get blacklist: %s", e)
+            self._api_requests["blacklist", "error"].inc()
 
     async def _collect_diagnostics_metrics(self, client: EeroClient, network_id: str) -> None:
         """Collect diagnostics metrics."""
         try:
             diagnostics = await client.get_diagnostics(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="diagnostics", status="success").inc()
+            self._api_requests["diagnostics", "success"].inc()
 
             if not diagnostics:
                 _LOGGER.debug("Diagnostics response is empty")
                 return
 
-            _LOGGER.debug(f"Diagnostics keys: {list(diagnostics.keys())}")
+            _LOGGER.debug("Diagnostics keys: %s", list(diagnostics.keys()))
 
             # Helper to extract latency from various possible structures
             def _extract_latency(data: dict, *keys: str) -> float | None:
@@ -1667,7 +1831,7 @@ class EeroCollector:
                 "wan_latency",
             )
             if internet_latency is not None:
-                DIAGNOSTICS_INTERNET_LATENCY.labels(network_id=network_id).set(internet_latency)
+                self._set(DIAGNOSTICS_INTERNET_LATENCY, (network_id,), internet_latency)
 
             # DNS latency
             dns_latency = _extract_latency(
@@ -1677,7 +1841,7 @@ class EeroCollector:
                 "dns",
             )
             if dns_latency is not None:
-                DIAGNOSTICS_DNS_LATENCY.labels(network_id=network_id).set(dns_latency)
+                self._set(DIAGNOSTICS_DNS_LATENCY, (network_id,), dns_latency)
 
             # Gateway latency
             gateway_latency = _extract_latency(
@@ -1688,7 +1852,7 @@ class EeroCollector:
                 "router_latency_ms",
             )
             if gateway_latency is not None:
-                DIAGNOSTICS_GATEWAY_LATENCY.labels(network_id=network_id).set(gateway_latency)
+                self._set(DIAGNOSTICS_GATEWAY_LATENCY, (network_id,), gateway_latency)
 
             # Last run timestamp
             last_run = (
@@ -1699,17 +1863,17 @@ class EeroCollector:
             if last_run:
                 last_run_ts = _parse_timestamp(last_run)
                 if last_run_ts is not None:
-                    DIAGNOSTICS_LAST_RUN_TIMESTAMP.labels(network_id=network_id).set(last_run_ts)
+                    self._set(DIAGNOSTICS_LAST_RUN_TIMESTAMP, (network_id,), last_run_ts)
 
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get diagnostics: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="diagnostics", status="error").inc()
+            _LOGGER.debug("Failed to get diagnostics: %s", e)
+            self._api_requests["diagnostics", "error"].inc()
 
     async def _collect_insights_metrics(self, client: EeroClient, network_id: str) -> None:
         """Collect insights metrics."""
         try:
             insights = await client.get_insights(network_id)
-            EXPORTER_API_REQUESTS.labels(endpoint="insights", status="success").inc()
+            self._api_requests["insights", "success"].inc()
 
             if not insights:
                 return
@@ -1717,14 +1881,12 @@ class EeroCollector:
             # Recommendations count
             recommendations = insights.get("recommendations", [])
             if isinstance(recommendations, list):
-                INSIGHTS_RECOMMENDATIONS_COUNT.labels(network_id=network_id).set(
-                    len(recommendations)
-                )
+                self._set(INSIGHTS_RECOMMENDATIONS_COUNT, (network_id,), len(recommendations))
 
             # Issues count
             issues = insights.get("issues", [])
             if isinstance(issues, list):
-                INSIGHTS_ISSUES_COUNT.labels(network_id=network_id).set(len(issues))
+                self._set(INSIGHTS_ISSUES_COUNT, (network_id,), len(issues))
 
             # Alternative field names
             if not recommendations and not issues:
@@ -1733,9 +1895,9 @@ class EeroCollector:
                 if isinstance(items, list):
                     rec_count = sum(1 for i in items if i.get("type") == "recommendation")
                     issue_count = sum(1 for i in items if i.get("type") == "issue")
-                    INSIGHTS_RECOMMENDATIONS_COUNT.labels(network_id=network_id).set(rec_count)
-                    INSIGHTS_ISSUES_COUNT.labels(network_id=network_id).set(issue_count)
+                    self._set(INSIGHTS_RECOMMENDATIONS_COUNT, (network_id,), rec_count)
+                    self._set(INSIGHTS_ISSUES_COUNT, (network_id,), issue_count)
 
         except EeroAPIError as e:
-            _LOGGER.debug(f"Failed to get insights: {e}")
-            EXPORTER_API_REQUESTS.labels(endpoint="insights", status="error").inc()
+            _LOGGER.debug("Failed to get insights: %s", e)
+            self._api_requests["insights", "error"].inc()
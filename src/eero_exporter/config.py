@@ -9,6 +9,8 @@ from pathlib import Path
 
 import yaml  # type: ignore[import-untyped]
 
+from .eero_adapter import DEFAULT_CACHE_TTL, DEFAULT_MAX_CONCURRENCY
+
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_PATH = Path.home() / ".config" / "eero-exporter"
@@ -34,6 +36,8 @@ class ExporterConfig:
     # Collection settings
     collection_interval: int = 60  # seconds
     timeout: int = 30  # seconds
+    cache_ttl: int = DEFAULT_CACHE_TTL  # seconds to reuse slow-changing settings responses
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY  # eero API requests in flight at once
 
     # Session settings
     session_file: Path = field(default_factory=lambda: DEFAULT_SESSION_FILE)
@@ -47,11 +51,16 @@ class ExporterConfig:
     # Logging
     log_level: str = "INFO"
 
+    def __post_init__(self) -> None:
+        """Reject settings the exporter cannot run with."""
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {self.max_concurrency}")
+
     @classmethod
     def from_file(cls, path: Path) -> "ExporterConfig":
         """Load configuration from a YAML file."""
         if not path.exists():
-            _LOGGER.info(f"Config file not found at {path}, using defaults")
+            _LOGGER.info("Config file not found at %s, using defaults", path)
             return cls()
 
         try:
@@ -67,7 +76,7 @@ class ExporterConfig:
 
             return cls(**data)
         except Exception as e:
-            _LOGGER.warning(f"Error loading config from {path}: {e}, using defaults")
+            _LOGGER.warning("Error loading config from %s: %s, using defaults", path, e)
             return cls()
 
     def save(self, path: Path | None = None) -> None:
@@ -81,6 +90,8 @@ class ExporterConfig:
             "metrics_path": self.metrics_path,
             "collection_interval": self.collection_interval,
             "timeout": self.timeout,
+            "cache_ttl": self.cache_ttl,
+            "max_concurrency": self.max_concurrency,
             "session_file": str(self.session_file),
             "include_devices": self.include_devices,
             "include_profiles": self.include_profiles,
@@ -92,7 +103,7 @@ class ExporterConfig:
         with open(save_path, "w") as f:
             yaml.dump(data, f, default_flow_style=False)
 
-        _LOGGER.info(f"Configuration saved to {save_path}")
+        _LOGGER.info("Configuration saved to %s", save_path)
 
 
 @dataclass
@@ -115,7 +126,7 @@ class SessionData:
     def from_file(cls, path: Path) -> "SessionData":
         """Load session data from a JSON file."""
         if not path.exists():
-            _LOGGER.debug(f"Session file not found at {path}")
+            _LOGGER.debug("Session file not found at %s", path)
             return cls()
 
         try:
@@ -123,7 +134,7 @@ class SessionData:
                 data = json.load(f)
             return cls(**data)
         except Exception as e:
-            _LOGGER.warning(f"Error loading session from {path}: {e}")
+            _LOGGER.warning("Error loading session from %s: %s", path, e)
             return cls()
 
     def save(self, path: Path) -> None:
@@ -144,7 +155,7 @@ class SessionData:
 
         # Set restrictive permissions (owner read/write only)
         os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
-        _LOGGER.info(f"Session saved to {path}")
+        _LOGGER.info("Session saved to %s", path)
 
     def clear(self, path: Path) -> None:
         """Clear session data and delete the file."""
@@ -157,4 +168,4 @@ class SessionData:
 
         if path.exists():
             path.unlink()
-            _LOGGER.info(f"Session file deleted: {path}")
+            _LOGGER.info("Session file deleted: %s", path)
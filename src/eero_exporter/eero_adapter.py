@@ -10,7 +10,13 @@ As of eero-api v2.0.0, all responses are raw JSON in the format:
 This adapter handles data extraction from the envelope.
 """
 
+import asyncio
+import copy
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any
 
@@ -52,6 +58,9 @@ __all__ = [
     "EeroClient",
     "EeroAPIError",
     "EeroAuthError",
+    "extract_id_from_url",
+    "extract_speed_test",
+    "served_from_cache",
 ]
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,17 +72,17 @@ def _wrap_api_call(message: str = "API call failed") -> Any:
     This ensures that any EeroAPIException or EeroAuthenticationException raised
     by the eero-api library is converted to our local EeroAPIError or EeroAuthError.
     """
-    from collections.abc import Callable
-    from functools import wraps
     from typing import TypeVar
 
     F = TypeVar("F", bound=Callable[..., Any])
 
     def decorator(func: F) -> F:
         @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        async def wrapper(self: "EeroClient", *args: Any, **kwargs: Any) -> Any:
             try:
-                return await func(*args, **kwargs)
+                # Bound the number of in-flight requests to the eero API
+                async with self._request_slots:
+                    return await func(self, *args, **kwargs)
             except _UpstreamAuthException as e:
                 raise EeroAuthError(str(e)) from e
             except _UpstreamAPIException as e:
@@ -84,10 +93,75 @@ def _wrap_api_call(message: str = "API call failed") -> Any:
     return decorator
 
 
+# Response cache key: (method name, positional args, sorted keyword items)
+_CacheKey = tuple[str, tuple[Any, ...], tuple[tuple[str, Any], ...]]
+
+# Whether the last cached-endpoint call made by the current task was served
+# from the response cache. Tasks get their own copy, so concurrently
+# collected networks do not see each other's calls.
+_served_from_cache: ContextVar[bool] = ContextVar("served_from_cache", default=False)
+
+
+def served_from_cache() -> bool:
+    """Report whether the last cached-endpoint call in this task was a cache hit.
+
+    Returns:
+        True if the most recent call to a cached endpoint, awaited by the
+        current task, was answered from the response cache without a request
+    """
+    return _served_from_cache.get()
+
+
+def _cache_key(name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> _CacheKey:
+    """Build the response cache key for a method call."""
+    return (name, args, tuple(sorted(kwargs.items())))
+
+
+def _cached_response(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Decorator caching a slow-changing endpoint's result for the client's cache TTL.
+
+    Results are keyed by method name and arguments and expire after
+    ``cache_ttl`` seconds. A TTL of 0 disables caching. Each call returns a
+    deep copy so callers cannot mutate the cached value. Apply it above
+    ``_wrap_api_call`` so that cache hits do not wait for a request slot.
+    Whether a call was a hit is reported through served_from_cache().
+    """
+
+    @wraps(func)
+    async def wrapper(self: "EeroClient", *args: Any, **kwargs: Any) -> Any:
+        if self._cache_ttl <= 0:
+            result = await func(self, *args, **kwargs)
+            _served_from_cache.set(False)
+            return result
+
+        key = _cache_key(func.__name__, args, kwargs)
+        now = time.monotonic()
+        cached = self._response_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _served_from_cache.set(True)
+            return copy.deepcopy(cached[1])
+
+        result = await func(self, *args, **kwargs)
+        self._response_cache[key] = (now + self._cache_ttl, result)
+        # Reported after the call, so a nested cached call cannot leave a hit behind
+        _served_from_cache.set(False)
+        return copy.deepcopy(result)
+
+    return wrapper
+
+
 # Default session file path - used as cookie storage for eero-api
 # This keeps backward compatibility with existing Docker setups using session.json
 DEFAULT_SESSION_FILE = Path.home() / ".config" / "eero-exporter" / "session.json"
 
+# All requests go to a single eero API host; cap how many are in flight at
+# once per client (the equivalent of a per-host connection limit)
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Settings endpoints (account, SQM, premium, backup config) change far less
+# often than the collection interval, so their responses are reused for this long
+DEFAULT_CACHE_TTL = 300
+
 
 def _extract_data(raw_response: Any) -> Any:
     """Extract data from raw API response envelope.
@@ -111,6 +185,26 @@ def _extract_data(raw_response: Any) -> Any:
     return raw_response
 
 
+# Keys under which the Eero API nests lists, tried in order
+_LIST_KEYS = ("data", "networks", "eeros", "devices", "profiles")
+
+
+def _as_list(value: Any) -> list[dict[str, Any]] | None:
+    """Return value as a list, unwrapping a nested {"data": [...]} container.
+
+    Args:
+        value: A list, a {"data": [...]} container, or anything else
+
+    Returns:
+        A copy of the list, or None if value holds no list
+    """
+    if isinstance(value, dict):
+        value = value.get("data")
+    if isinstance(value, list):
+        return list(value)
+    return None
+
+
 def _extract_list(raw_response: Any, list_key: str | None = None) -> list[dict[str, Any]]:
     """Extract a list from raw API response.
 
@@ -138,32 +232,78 @@ def _extract_list(raw_response: Any, list_key: str | None = None) -> list[dict[s
         return list(data)
 
     if isinstance(data, dict):
-        # Try specific list_key first
-        if list_key and list_key in data:
-            result = data[list_key]
-            # Handle nested {"key": {"data": [...]}} structure
-            if isinstance(result, dict) and "data" in result:
-                nested = result["data"]
-                if isinstance(nested, list):
-                    return list(nested)
-            if isinstance(result, list):
-                return list(result)
-
-        # Try common list keys
-        for key in ["data", "networks", "eeros", "devices", "profiles"]:
+        # Try specific list_key first, then common list keys
+        keys = (list_key, *_LIST_KEYS) if list_key else _LIST_KEYS
+        for key in keys:
             if key in data:
-                result = data[key]
-                # Handle nested structure
-                if isinstance(result, dict) and "data" in result:
-                    nested = result["data"]
-                    if isinstance(nested, list):
-                        return list(nested)
-                if isinstance(result, list):
-                    return list(result)
+                result = _as_list(data[key])
+                if result is not None:
+                    return result
 
     return []
 
 
+def _first_network_id(networks: list[dict[str, Any]]) -> str | None:
+    """Return the ID of the first network in a network list.
+
+    Only the first network's URL is inspected; the rest of the list is
+    never touched.
+
+    Args:
+        networks: Network list as returned by get_networks()
+
+    Returns:
+        Network ID, or None if the list is empty or has no URL
+    """
+    if not networks:
+        return None
+    url = networks[0].get("url")
+    if not url:
+        return None
+    return extract_id_from_url(url)
+
+
+def extract_id_from_url(url: Any) -> str:
+    """Extract the ID from an eero API resource URL.
+
+    Args:
+        url: Resource URL (e.g., "/2.2/networks/12345")
+
+    Returns:
+        The last path segment of the URL, ignoring any query or fragment,
+        or "" if there is no URL
+    """
+    if not url:
+        return ""
+    return _extract_id_from_str(str(url))
+
+
+@lru_cache(maxsize=4096)
+def _extract_id_from_str(url: str) -> str:
+    """Extract the trailing path segment of a URL, memoized by the raw URL."""
+    path = url.partition("?")[0].partition("#")[0]
+    return path.rstrip("/").rpartition("/")[2]
+
+
+def extract_speed_test(network_data: dict[str, Any]) -> dict[str, Any] | None:
+    """Extract the latest speed test results from network details.
+
+    The network details response already embeds the last speed test, so
+    callers holding it should use this instead of issuing another request.
+
+    Args:
+        network_data: Network details as returned by get_network()
+
+    Returns:
+        Speed test data, or None if not present
+    """
+    # eero-api returns "speed_test", but check "speed" as fallback for compatibility
+    speed_data = network_data.get("speed_test") or network_data.get("speed")
+    if isinstance(speed_data, dict):
+        return speed_data
+    return None
+
+
 class EeroClient:
     """Adapter wrapping eero-api for the Prometheus exporter.
 
@@ -187,6 +327,8 @@ class EeroClient:
         timeout: int = 30,
         cookie_file: str | None = None,
         use_keyring: bool = False,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """Initialize the eero client adapter.
 
@@ -196,44 +338,121 @@ class EeroClient:
             timeout: Request timeout in seconds (currently unused)
             cookie_file: Path to cookie file for credential storage
             use_keyring: Whether to use system keyring (default: False for Docker)
+            cache_ttl: Seconds to cache slow-changing settings endpoints (0 disables)
+            max_concurrency: Maximum number of concurrent API requests
         """
         # Note: session_id and user_token are ignored - eero-api manages auth internally
         self._timeout = timeout
         self._cookie_file = cookie_file or str(DEFAULT_SESSION_FILE)
         self._use_keyring = use_keyring
+        self._cache_ttl = cache_ttl
+        self._response_cache: dict[_CacheKey, tuple[float, Any]] = {}
+        self._request_slots = asyncio.Semaphore(max_concurrency)
         self._client: BaseEeroClient | None = None
         self._preferred_network_id: str | None = None
 
     @property
     def is_authenticated(self) -> bool:
         """Check if the client is authenticated."""
-        if self._client:
-            return bool(self._client.is_authenticated)
-        return False
+        if self._client is None:
+            return False
+        return bool(self._client.is_authenticated)
+
+    @staticmethod
+    def extract_network_id(url: Any) -> str:
+        """Extract the network ID from a network URL.
+
+        Args:
+            url: Network URL (e.g., "/2.2/networks/12345")
+
+        Returns:
+            The last path segment of the URL, ignoring any query or fragment
+        """
+        return extract_id_from_url(url)
+
+    @property
+    def _api(self) -> Any:
+        """Return the open upstream client.
+
+        Raises:
+            EeroAPIError: If the client has not been opened
+        """
+        client = self._client
+        if client is None:
+            raise EeroAPIError("Client not initialized. Use async context manager.")
+        return client
+
+    async def open(self) -> "EeroClient":
+        """Open the underlying eero-api client.
+
+        The upstream client owns the HTTP session and its connection pool, so
+        keeping it open lets consecutive requests reuse keep-alive connections
+        instead of paying a new TCP/TLS handshake each time. Calling this on an
+        already open client is a no-op.
+        """
+        if self._client is not None:
+            return self
 
-    async def __aenter__(self) -> "EeroClient":
-        """Enter async context manager."""
         # Ensure cookie directory exists
         cookie_path = Path(self._cookie_file)
         cookie_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize the eero client
-        self._client = BaseEeroClient(
+        client = BaseEeroClient(
             cookie_file=self._cookie_file,
             use_keyring=self._use_keyring,
         )
         try:
-            await self._client.__aenter__()
+            await client.__aenter__()
         except _UpstreamAuthException as e:
             raise EeroAuthError(str(e)) from e
         except _UpstreamAPIException as e:
             raise EeroAPIError(str(e)) from e
+        self._client = client
         return self
 
+    async def close(self) -> None:
+        """Close the underlying eero-api client and release its connections."""
+        self._response_cache.clear()
+        if self._client is None:
+            return
+        client, self._client = self._client, None
+        await client.__aexit__(None, None, None)
+
+    async def __aenter__(self) -> "EeroClient":
+        """Enter async context manager."""
+        return await self.open()
+
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit async context manager."""
-        if self._client:
-            await self._client.__aexit__(exc_type, exc_val, exc_tb)
+        await self.close()
+
+    async def _get_dict(self, endpoint: str, *args: Any) -> dict[str, Any]:
+        """Call an upstream endpoint and unwrap its data object.
+
+        Args:
+            endpoint: Name of the eero-api client method to call
+            *args: Positional arguments for that method
+
+        Returns:
+            The response's data object as a dict
+        """
+        raw_response = await getattr(self._api, endpoint)(*args)
+        return dict(_extract_data(raw_response))
+
+    async def _get_list(self, endpoint: str, key: str, *args: Any) -> list[dict[str, Any]]:
+        """Call an upstream endpoint and unwrap its list of items.
+
+        Args:
+            endpoint: Name of the eero-api client method to call
+            key: Key the list may be nested under in the data object
+            *args: Positional arguments for that method
+
+        Returns:
+            The list of items in the response
+        """
+        raw_response = await getattr(self._api, endpoint)(*args)
+        return _extract_list(raw_response, key)
 
     # =========================================================================
     # Authentication
@@ -249,10 +468,7 @@ class EeroClient:
         Returns:
             A placeholder token (actual auth is managed by eero-api)
         """
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        success = await self._client.login(identifier)
+        success = await self._api.login(identifier)
         if not success:
             raise EeroAuthError("Login request failed")
 
@@ -269,24 +485,16 @@ class EeroClient:
         Returns:
             Session data (placeholder for compatibility)
         """
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        success = await self._client.verify(code)
+        success = await self._api.verify(code)
         if not success:
             raise EeroAuthError("Verification failed")
 
         # Get preferred network ID from raw response
         try:
-            raw_networks = await self._client.get_networks()
-            networks = _extract_list(raw_networks, "networks")
-            if networks:
-                network = networks[0]
-                url = network.get("url", "")
-                if url:
-                    parts = str(url).rstrip("/").split("/")
-                    if parts:
-                        self._preferred_network_id = parts[-1]
+            raw_networks = await self._api.get_networks()
+            network_id = _first_network_id(_extract_list(raw_networks, "networks"))
+            if network_id:
+                self._preferred_network_id = network_id
         except Exception:
             pass
 
@@ -300,41 +508,27 @@ class EeroClient:
     # Account & Networks
     # =========================================================================
 
+    @_cached_response
     @_wrap_api_call("Failed to get account")
     async def get_account(self) -> dict[str, Any]:
         """Get account information."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_account()
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_account")
 
     @_wrap_api_call("Failed to get networks")
     async def get_networks(self) -> list[dict[str, Any]]:
         """Get list of networks."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_networks()
-        result = _extract_list(raw_response, "networks")
+        result = await self._get_list("get_networks", "networks")
 
         # Set preferred network if not set
-        if not self._preferred_network_id and result:
-            network_url = result[0].get("url", "")
-            parts = str(network_url).rstrip("/").split("/")
-            if parts:
-                self._preferred_network_id = parts[-1]
+        if not self._preferred_network_id:
+            self._preferred_network_id = _first_network_id(result)
 
         return result
 
     @_wrap_api_call("Failed to get network")
     async def get_network(self, network_id: str) -> dict[str, Any]:
         """Get detailed network information."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_network(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_network", network_id)
 
     # =========================================================================
     # Eero Devices
@@ -343,11 +537,7 @@ class EeroClient:
     @_wrap_api_call("Failed to get eeros")
     async def get_eeros(self, network_id: str) -> list[dict[str, Any]]:
         """Get list of eero devices in a network."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_eeros(network_id)
-        return _extract_list(raw_response, "eeros")
+        return await self._get_list("get_eeros", "eeros", network_id)
 
     # =========================================================================
     # Client Devices
@@ -356,11 +546,7 @@ class EeroClient:
     @_wrap_api_call("Failed to get devices")
     async def get_devices(self, network_id: str) -> list[dict[str, Any]]:
         """Get list of client devices in a network."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_devices(network_id)
-        return _extract_list(raw_response, "devices")
+        return await self._get_list("get_devices", "devices", network_id)
 
     # =========================================================================
     # Profiles
@@ -369,11 +555,7 @@ class EeroClient:
     @_wrap_api_call("Failed to get profiles")
     async def get_profiles(self, network_id: str) -> list[dict[str, Any]]:
         """Get list of profiles in a network."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_profiles(network_id)
-        return _extract_list(raw_response, "profiles")
+        return await self._get_list("get_profiles", "profiles", network_id)
 
     # =========================================================================
     # Speed Test
@@ -385,18 +567,12 @@ class EeroClient:
 
         Note: eero-api uses run_speed_test() to trigger new tests.
         This method gets the last known speed data from network info.
+        If the network details were already fetched, use
+        extract_speed_test() on them to avoid a second request.
         """
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
         # Get speed data from network info
-        raw_response = await self._client.get_network(network_id)
-        network_data = _extract_data(raw_response)
-        # eero-api returns "speed_test", but check "speed" as fallback for compatibility
-        speed_data = network_data.get("speed_test") or network_data.get("speed", {})
-        if isinstance(speed_data, dict):
-            return speed_data
-        return None
+        raw_response = await self._api.get_network(network_id)
+        return extract_speed_test(_extract_data(raw_response))
 
     # =========================================================================
     # Transfer Stats
@@ -407,37 +583,27 @@ class EeroClient:
         self, network_id: str, device_id: str | None = None
     ) -> dict[str, Any]:
         """Get transfer statistics for network or device."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_transfer_stats(network_id, device_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_transfer_stats", network_id, device_id)
 
     # =========================================================================
     # SQM Settings
     # =========================================================================
 
+    @_cached_response
     @_wrap_api_call("Failed to get SQM settings")
     async def get_sqm_settings(self, network_id: str) -> dict[str, Any]:
         """Get SQM (Smart Queue Management) settings."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_sqm_settings(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_sqm_settings", network_id)
 
     # =========================================================================
     # Security Settings
     # =========================================================================
 
+    @_cached_response
     @_wrap_api_call("Failed to get security settings")
     async def get_security_settings(self, network_id: str) -> dict[str, Any]:
         """Get security settings for the network."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_security_settings(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_security_settings", network_id)
 
     # =========================================================================
     # Premium Features (Eero Plus)
@@ -446,20 +612,14 @@ class EeroClient:
     @_wrap_api_call("Failed to get premium status")
     async def get_premium_status(self, network_id: str) -> dict[str, Any]:
         """Get Eero Plus/Secure subscription status."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_premium_status(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_premium_status", network_id)
 
+    @_cached_response
     @_wrap_api_call("Failed to check premium status")
     async def is_premium(self, network_id: str) -> bool:
         """Check if the network has an active Eero Plus subscription."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
         # get_premium_status returns network data with premium status fields
-        raw_response = await self._client.get_premium_status(network_id)
+        raw_response = await self._api.get_premium_status(network_id)
         if isinstance(raw_response, bool):
             return raw_response
         if isinstance(raw_response, dict):
@@ -484,60 +644,38 @@ class EeroClient:
     @_wrap_api_call("Failed to get activity")
     async def get_activity(self, network_id: str) -> dict[str, Any]:
         """Get network activity summary (Eero Plus feature)."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_activity(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_activity", network_id)
 
     @_wrap_api_call("Failed to get activity clients")
     async def get_activity_clients(self, network_id: str) -> list[dict[str, Any]]:
         """Get per-client activity data (Eero Plus feature)."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_activity_clients(network_id)
-        return _extract_list(raw_response, "clients")
+        return await self._get_list("get_activity_clients", "clients", network_id)
 
     @_wrap_api_call("Failed to get activity categories")
     async def get_activity_categories(self, network_id: str) -> list[dict[str, Any]]:
         """Get activity data grouped by category (Eero Plus feature)."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_activity_categories(network_id)
-        return _extract_list(raw_response, "categories")
+        return await self._get_list("get_activity_categories", "categories", network_id)
 
     # =========================================================================
     # Backup Network (Eero Plus)
     # =========================================================================
 
+    @_cached_response
     @_wrap_api_call("Failed to get backup network")
     async def get_backup_network(self, network_id: str) -> dict[str, Any]:
         """Get backup network configuration (Eero Plus feature)."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_backup_network(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_backup_network", network_id)
 
     @_wrap_api_call("Failed to get backup status")
     async def get_backup_status(self, network_id: str) -> dict[str, Any]:
         """Get current backup network status (Eero Plus feature)."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_backup_status(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_backup_status", network_id)
 
     @_wrap_api_call("Failed to check backup status")
     async def is_using_backup(self, network_id: str) -> bool:
         """Check if the network is currently using backup connection."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
         # get_backup_status returns backup status data
-        raw_response = await self._client.get_backup_status(network_id)
+        raw_response = await self._api.get_backup_status(network_id)
         if isinstance(raw_response, bool):
             return raw_response
         if isinstance(raw_response, dict):
@@ -557,11 +695,7 @@ class EeroClient:
     @_wrap_api_call("Failed to get thread data")
     async def get_thread(self, network_id: str) -> dict[str, Any]:
         """Get Thread network information."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_thread(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_thread", network_id)
 
     # =========================================================================
     # Port Forwards
@@ -570,11 +704,7 @@ class EeroClient:
     @_wrap_api_call("Failed to get port forwards")
     async def get_forwards(self, network_id: str) -> list[dict[str, Any]]:
         """Get list of port forwarding rules."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_forwards(network_id)
-        return _extract_list(raw_response, "forwards")
+        return await self._get_list("get_forwards", "forwards", network_id)
 
     # =========================================================================
     # DHCP Reservations
@@ -583,11 +713,7 @@ class EeroClient:
     @_wrap_api_call("Failed to get DHCP reservations")
     async def get_reservations(self, network_id: str) -> list[dict[str, Any]]:
         """Get list of DHCP reservations."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_reservations(network_id)
-        return _extract_list(raw_response, "reservations")
+        return await self._get_list("get_reservations", "reservations", network_id)
 
     # =========================================================================
     # Blacklist
@@ -596,11 +722,7 @@ class EeroClient:
     @_wrap_api_call("Failed to get blacklist")
     async def get_blacklist(self, network_id: str) -> list[dict[str, Any]]:
         """Get list of blacklisted devices."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_blacklist(network_id)
-        return _extract_list(raw_response, "blacklist")
+        return await self._get_list("get_blacklist", "blacklist", network_id)
 
     # =========================================================================
     # Updates
@@ -609,11 +731,7 @@ class EeroClient:
     @_wrap_api_call("Failed to get updates")
     async def get_updates(self, network_id: str) -> dict[str, Any]:
         """Get firmware update information."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_updates(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_updates", network_id)
 
     # =========================================================================
     # Insights
@@ -622,11 +740,7 @@ class EeroClient:
     @_wrap_api_call("Failed to get insights")
     async def get_insights(self, network_id: str) -> dict[str, Any]:
         """Get network insights and recommendations."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_insights(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_insights", network_id)
 
     # =========================================================================
     # Diagnostics
@@ -635,8 +749,4 @@ class EeroClient:
     @_wrap_api_call("Failed to get diagnostics")
     async def get_diagnostics(self, network_id: str) -> dict[str, Any]:
         """Get network diagnostics information."""
-        if not self._client:
-            raise EeroAPIError("Client not initialized. Use async context manager.")
-
-        raw_response = await self._client.get_diagnostics(network_id)
-        return dict(_extract_data(raw_response))
+        return await self._get_dict("get_diagnostics", network_id)
@@ -207,26 +207,26 @@ EERO_BACKUP_CONNECTION = Gauge(
 ETHERNET_PORT_CARRIER = Gauge(
     f"{PREFIX}_ethernet_port_carrier",
     "Whether the Ethernet port has link (1=yes, 0=no)",
-    labelnames=["network_id", "eero_id", "location", "port_number", "port_name"],
+    labelnames=["network_id", "eero_id", "port_number"],
 )
 
 ETHERNET_PORT_SPEED = Gauge(
     f"{PREFIX}_ethernet_port_speed_mbps",
     "Ethernet port negotiated speed in megabits per second (Mbps). "
     "Common values: 100 (Fast Ethernet), 1000 (Gigabit), 2500 (2.5G).",
-    labelnames=["network_id", "eero_id", "location", "port_number", "port_name"],
+    labelnames=["network_id", "eero_id", "port_number"],
 )
 
 ETHERNET_PORT_IS_WAN = Gauge(
     f"{PREFIX}_ethernet_port_is_wan",
     "Whether the Ethernet port is used for WAN (1=yes, 0=no)",
-    labelnames=["network_id", "eero_id", "location", "port_number", "port_name"],
+    labelnames=["network_id", "eero_id", "port_number"],
 )
 
 ETHERNET_PORT_POWER_SAVING = Gauge(
     f"{PREFIX}_ethernet_port_power_saving",
     "Whether power saving is enabled on the port (1=yes, 0=no)",
-    labelnames=["network_id", "eero_id", "location", "port_number", "port_name"],
+    labelnames=["network_id", "eero_id", "port_number"],
 )
 
 EERO_WIRED_INTERNET = Gauge(
@@ -647,13 +647,13 @@ ACTIVITY_CATEGORY_BYTES = Gauge(
 DEVICE_ACTIVITY_DOWNLOAD_BYTES = Gauge(
     f"{PREFIX}_device_activity_download_bytes",
     "Device activity download bytes (current period)",
-    labelnames=["network_id", "device_id", "name", "manufacturer", "device_type"],
+    labelnames=["network_id", "device_id", "manufacturer", "device_type"],
 )
 
 DEVICE_ACTIVITY_UPLOAD_BYTES = Gauge(
     f"{PREFIX}_device_activity_upload_bytes",
     "Device activity upload bytes (current period)",
-    labelnames=["network_id", "device_id", "name", "manufacturer", "device_type"],
+    labelnames=["network_id", "device_id", "manufacturer", "device_type"],
 )
 
 # =============================================================================
@@ -932,6 +932,12 @@ EXPORTER_LAST_COLLECTION_TIMESTAMP = Gauge(
     "Metrics are cached between collections per Prometheus guidelines for expensive APIs.",
 )
 
+EXPORTER_LAST_COLLECTION_AGE = Gauge(
+    f"{PREFIX}_exporter_last_collection_age_seconds",
+    "Seconds since the last metrics collection finished, evaluated at scrape time. "
+    "Keeps growing if the background collection stalls.",
+)
+
 EXPORTER_COLLECTION_INTERVAL = Gauge(
     f"{PREFIX}_exporter_collection_interval_seconds",
     "Configured collection interval in seconds. Prometheus scrapes may receive cached data.",
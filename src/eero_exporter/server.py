@@ -4,8 +4,10 @@ import asyncio
 import json
 import logging
 import signal
+from collections.abc import Callable, Coroutine
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from threading import Thread
+from typing import Any
 
 from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 
@@ -13,6 +15,13 @@ from . import __version__
 from .collector import EeroCollector
 from .config import ExporterConfig
 
+try:
+    import uvloop
+
+    _LOOP_FACTORY: Callable[[], asyncio.AbstractEventLoop] | None = uvloop.new_event_loop
+except ImportError:  # uvloop is an optional speedup
+    _LOOP_FACTORY = None
+
 _LOGGER = logging.getLogger(__name__)
 
 # Global state for health checks
@@ -30,7 +39,7 @@ class MetricsHandler(SimpleHTTPRequestHandler):
 
     def log_message(self, format: str, *args: object) -> None:
         """Override to use our logger."""
-        _LOGGER.debug(f"HTTP: {format % args}")
+        _LOGGER.debug("HTTP: " + format, *args)
 
     def do_GET(self) -> None:
         """Handle GET requests."""
@@ -55,7 +64,7 @@ class MetricsHandler(SimpleHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(output)
         except Exception as e:
-            _LOGGER.error(f"Error generating metrics: {e}")
+            _LOGGER.error("Error generating metrics: %s", e)
             self.send_error(500)
 
     def _serve_ready(self) -> None:
@@ -235,7 +244,7 @@ async def collection_loop(
         interval: Collection interval in seconds
         stop_event: Event to signal shutdown
     """
-    _LOGGER.info(f"Starting collection loop (interval: {interval}s)")
+    _LOGGER.info("Starting collection loop (interval: %ss)", interval)
 
     async def do_collection() -> None:
         """Perform collection and update health state."""
@@ -278,6 +287,11 @@ async def collection_loop(
     _LOGGER.info("Collection loop stopped")
 
 
+def run_async(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    asyncio.run(coro, loop_factory=_LOOP_FACTORY)
+
+
 def run_server(config: ExporterConfig) -> None:
     """Run the metrics server.
 
@@ -290,13 +304,15 @@ def run_server(config: ExporterConfig) -> None:
         include_profiles=config.include_profiles,
         timeout=config.timeout,
         cookie_file=str(config.session_file),
+        cache_ttl=config.cache_ttl,
+        max_concurrency=config.max_concurrency,
     )
     # Set collection interval for caching metrics
     collector._collection_interval = config.collection_interval
 
     # Create HTTP server
     server = HTTPServer((config.host, config.port), MetricsHandler)
-    _LOGGER.info(f"HTTP server listening on {config.host}:{config.port}")
+    _LOGGER.info("HTTP server listening on %s:%s", config.host, config.port)
 
     # Create stop event for graceful shutdown
     stop_event = asyncio.Event()
@@ -304,7 +320,7 @@ def run_server(config: ExporterConfig) -> None:
 
     def signal_handler(signum: int, frame: object) -> None:
         """Handle shutdown signals."""
-        _LOGGER.info(f"Received signal {signum}, shutting down...")
+        _LOGGER.info("Received signal %s, shutting down...", signum)
         if loop:
             loop.call_soon_threadsafe(stop_event.set)
         server.shutdown()
@@ -322,10 +338,13 @@ def run_server(config: ExporterConfig) -> None:
     async def main() -> None:
         nonlocal loop
         loop = asyncio.get_running_loop()
-        await collection_loop(collector, config.collection_interval, stop_event)
+        try:
+            await collection_loop(collector, config.collection_interval, stop_event)
+        finally:
+            await collector.close()
 
     try:
-        asyncio.run(main())
+        run_async(main())
     except KeyboardInterrupt:
         _LOGGER.info("Keyboard interrupt received")
     finally:
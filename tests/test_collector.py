@@ -0,0 +1,468 @@
+"""Tests for the eero metrics collector."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("eero")
+pytest.importorskip("prometheus_client")
+
+from prometheus_client import REGISTRY, CollectorRegistry, Gauge, Info  # noqa: E402
+
+from eero_exporter import collector as collector_module  # noqa: E402
+from eero_exporter.collector import (  # noqa: E402
+    EeroCollector,
+    _frequency_to_band,
+    _parse_bitrate,
+    _parse_iso_timestamp,
+    _parse_signal_strength,
+    _parse_speed_mbps,
+)
+from eero_exporter.eero_adapter import EeroAPIError, EeroAuthError, EeroClient  # noqa: E402
+
+
+class _Clock:
+    """Stand-in for the time module with a manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Replace the collector's clock so the Info refresh interval can be stepped."""
+    fake = _Clock()
+    monkeypatch.setattr(collector_module, "time", SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+@pytest.mark.parametrize(
+    ("frequency", "band"),
+    [
+        (None, "unknown"),
+        (0, "unknown"),
+        (2399, "unknown"),
+        (2400, "2.4GHz"),
+        (2412, "2.4GHz"),
+        (2500, "2.4GHz"),
+        (2501, "unknown"),
+        (5149, "unknown"),
+        (5150, "5GHz"),
+        (5925, "5GHz"),
+        (5926, "6GHz"),
+        (7125, "6GHz"),
+        (7126, "unknown"),
+    ],
+)
+def test_frequency_to_band_edges(frequency: int | None, band: str) -> None:
+    """Band edges are inclusive and the shared 5925 MHz edge stays 5GHz."""
+    assert _frequency_to_band(frequency) == band
+
+
+@pytest.mark.parametrize(
+    ("signal", "expected"),
+    [
+        ("-55 dBm", -55.0),
+        ("-61.5 dBm", -61.5),
+        (" -70dBm", -70.0),
+        ("-48", -48.0),
+        (-63, -63.0),
+        ("n/a", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_signal_strength(signal: Any, expected: float | None) -> None:
+    """The leading number of a signal string is read; numbers pass through."""
+    assert _parse_signal_strength(signal) == expected
+
+
+@pytest.mark.parametrize(
+    ("bitrate", "expected"),
+    [
+        ("866.7 Mbit/s", 866.7),
+        ("433 Mbps", 433.0),
+        ("1200", 1200.0),
+        ("fast", None),
+        ("866.7 Mbit/s burst", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_bitrate(bitrate: Any, expected: float | None) -> None:
+    """Bitrates with or without a Mbit/s unit parse; anything else yields None."""
+    assert _parse_bitrate(bitrate) == expected
+
+
+@pytest.mark.parametrize(
+    ("speed", "expected"),
+    [
+        ("1 Gbps", 1000.0),
+        ("2.5G", 2500.0),
+        ("1 Gb", 1000.0),
+        ("100 Mbps", 100.0),
+        ("100M", 100.0),
+        ("100 mb", 100.0),
+        ("10kbps", 0.01),
+        ("1000", 1000.0),
+        (1000, 1000.0),
+        (2.5, 2.5),
+        (True, None),
+        ("auto", None),
+        ("1 Gbps full", None),
+        (None, None),
+    ],
+)
+def test_parse_speed_mbps(speed: Any, expected: float | None) -> None:
+    """Port speeds, numeric or with a G/M/K unit, are converted to Mbps."""
+    assert _parse_speed_mbps(speed) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ("timestamp", "expected"),
+    [
+        ("2024-01-15T10:30:00Z", 1705314600.0),
+        ("2024-01-15T10:30:00.250Z", 1705314600.25),
+        ("2024-01-15T12:30:00+02:00", 1705314600.0),
+        ("2024-01-15T05:30:00-0500", 1705314600.0),
+    ],
+)
+def test_parse_iso_timestamp_zoned(timestamp: str, expected: float) -> None:
+    """Zulu and numeric-offset timestamps convert to the same epoch."""
+    assert _parse_iso_timestamp(timestamp) == pytest.approx(expected)
+
+
+def test_parse_iso_timestamp_naive_uses_local_time() -> None:
+    """Naive timestamps fall back to datetime's local-time interpretation."""
+    expected = datetime(2024, 1, 15, 10, 30).timestamp()
+    assert _parse_iso_timestamp("2024-01-15T10:30:00") == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("timestamp", ["2024-02-30T10:30:00Z", "yesterday", ""])
+def test_parse_iso_timestamp_invalid(timestamp: str) -> None:
+    """Impossible dates and non-ISO strings yield None."""
+    assert _parse_iso_timestamp(timestamp) is None
+
+
+def test_set_skips_unchanged_value() -> None:
+    """A repeated value is not rewritten; a changed value is."""
+    collector = EeroCollector()
+    registry = CollectorRegistry()
+    metric = Gauge("test_clients", "Test clients.", ["network_id"], registry=registry)
+
+    collector._set(metric, ("n1",), 3)
+    # Overwrite the child directly so a skipped write leaves this value behind
+    metric.labels("n1").set(99)
+    collector._set(metric, ("n1",), 3)
+    assert registry.get_sample_value("test_clients", {"network_id": "n1"}) == 99
+
+    collector._set(metric, ("n1",), 4)
+    assert registry.get_sample_value("test_clients", {"network_id": "n1"}) == 4
+
+
+def _info_sample(registry: CollectorRegistry, isp: str) -> float | None:
+    return registry.get_sample_value("test_network_info", {"network_id": "n1", "isp": isp})
+
+
+def test_set_info_skips_unchanged_payload_until_refresh(clock: _Clock) -> None:
+    """An unchanged payload is rewritten only once the refresh interval has passed."""
+    collector = EeroCollector()
+    registry = CollectorRegistry()
+    metric = Info("test_network", "Test network info.", ["network_id"], registry=registry)
+
+    collector._set_info(metric, ("n1",), {"isp": "Acme"})
+    # Overwrite the child directly so a skipped write leaves this payload behind
+    metric.labels("n1").info({"isp": "stale"})
+    clock.now += collector_module.INFO_REFRESH_INTERVAL - 1
+    collector._set_info(metric, ("n1",), {"isp": "Acme"})
+    assert _info_sample(registry, "stale") == 1
+
+    clock.now += 2
+    collector._set_info(metric, ("n1",), {"isp": "Acme"})
+    assert _info_sample(registry, "Acme") == 1
+
+
+def test_set_info_writes_changed_payload() -> None:
+    """A changed payload is written immediately."""
+    collector = EeroCollector()
+    registry = CollectorRegistry()
+    metric = Info("test_network", "Test network info.", ["network_id"], registry=registry)
+
+    collector._set_info(metric, ("n1",), {"isp": "Acme"})
+    collector._set_info(metric, ("n1",), {"isp": "Globex"})
+    assert _info_sample(registry, "Globex") == 1
+    assert _info_sample(registry, "Acme") is None
+
+
+class _DevicesClient:
+    """API client stub serving a mutable device list."""
+
+    def __init__(self) -> None:
+        self.devices: list[dict[str, Any]] = []
+
+    async def get_devices(self, network_id: str) -> list[dict[str, Any]]:
+        return [dict(device) for device in self.devices]
+
+
+def _device(device_id: str) -> dict[str, Any]:
+    return {
+        "url": f"/2.2/devices/{device_id}",
+        "mac": f"mac-{device_id}",
+        "display_name": f"Device {device_id}",
+        "connected": True,
+        "wireless": False,
+    }
+
+
+def _connected_sample(network_id: str, device_id: str) -> float | None:
+    return REGISTRY.get_sample_value(
+        "eero_device_connected",
+        {
+            "network_id": network_id,
+            "device_id": device_id,
+            "name": f"Device {device_id}",
+            "mac": f"mac-{device_id}",
+            "manufacturer": "unknown",
+            "device_type": "unknown",
+            "connection_type": "wired",
+            "source_eero": "unknown",
+        },
+    )
+
+
+def _cached_keys(collector: EeroCollector, network_id: str, device_id: str) -> list[Any]:
+    caches = (collector._label_children, collector._last_values, collector._info_payloads)
+    return [key for cache in caches for key in cache if key[1][:2] == (network_id, device_id)]
+
+
+async def test_departed_device_series_are_removed_and_return() -> None:
+    """A device missing from the list loses its series; a returning one gets them back."""
+    collector = EeroCollector()
+    client: Any = _DevicesClient()
+
+    client.devices = [_device("d1"), _device("d2")]
+    await collector._collect_device_metrics(client, "net-departed", "Home")
+    assert _connected_sample("net-departed", "d1") == 1
+    assert _connected_sample("net-departed", "d2") == 1
+    assert _cached_keys(collector, "net-departed", "d2")
+
+    client.devices = [_device("d1")]
+    await collector._collect_device_metrics(client, "net-departed", "Home")
+    assert _connected_sample("net-departed", "d1") == 1
+    assert _connected_sample("net-departed", "d2") is None
+    assert _cached_keys(collector, "net-departed", "d2") == []
+
+    client.devices = [_device("d1"), _device("d2")]
+    await collector._collect_device_metrics(client, "net-departed", "Home")
+    assert _connected_sample("net-departed", "d2") == 1
+    assert _cached_keys(collector, "net-departed", "d2")
+
+
+class _NetworkClient:
+    """API client stub for a single network, recording the endpoints called."""
+
+    def __init__(self, status: str) -> None:
+        self.status = status
+        self.devices: list[dict[str, Any]] = []
+        self.calls: list[str] = []
+
+    async def get_network(self, network_id: str) -> dict[str, Any]:
+        self.calls.append("get_network")
+        return {"status": self.status}
+
+    async def get_eeros(self, network_id: str) -> list[dict[str, Any]]:
+        self.calls.append("get_eeros")
+        return []
+
+    async def get_sqm_settings(self, network_id: str) -> dict[str, Any]:
+        self.calls.append("get_sqm_settings")
+        return {}
+
+    async def get_devices(self, network_id: str) -> list[dict[str, Any]]:
+        self.calls.append("get_devices")
+        return [dict(device) for device in self.devices]
+
+
+def _devices_only_collector() -> EeroCollector:
+    """Build a collector whose only optional sub-collection is the device list."""
+    return EeroCollector(
+        include_profiles=False,
+        include_premium=False,
+        include_thread=False,
+        include_port_forwards=False,
+        include_reservations=False,
+        include_blacklist=False,
+        include_diagnostics=False,
+        include_insights=False,
+    )
+
+
+def _network(network_id: str) -> dict[str, Any]:
+    return {"url": f"/2.2/networks/{network_id}", "name": "Cabin"}
+
+
+async def test_offline_network_only_refreshes_eeros() -> None:
+    """An offline network skips its sub-collections until it is back online."""
+    collector = _devices_only_collector()
+    client: Any = _NetworkClient("offline")
+
+    await collector._collect_network_metrics(client, _network("net-offline"))
+    assert client.calls == ["get_network", "get_eeros"]
+
+    client.status = "online"
+    client.calls.clear()
+    await collector._collect_network_metrics(client, _network("net-offline"))
+    assert sorted(client.calls) == ["get_devices", "get_eeros", "get_network", "get_sqm_settings"]
+
+
+@pytest.mark.parametrize("status", ["", "unknown"])
+async def test_unknown_network_status_skips_nothing(status: str) -> None:
+    """A missing or unknown status is not treated as offline."""
+    collector = _devices_only_collector()
+    client: Any = _NetworkClient(status)
+
+    await collector._collect_network_metrics(client, _network("net-unknown"))
+    assert "get_devices" in client.calls
+
+
+async def test_offline_network_reports_no_connected_clients() -> None:
+    """Client counts and device connected flags drop to 0 while a network is offline."""
+    collector = _devices_only_collector()
+    client: Any = _NetworkClient("online")
+    client.devices = [_device("d1")]
+    labels = {"network_id": "net-down", "name": "Cabin"}
+
+    await collector._collect_network_metrics(client, _network("net-down"))
+    assert REGISTRY.get_sample_value("eero_network_clients_count", labels) == 1
+    assert _connected_sample("net-down", "d1") == 1
+
+    client.status = "offline"
+    await collector._collect_network_metrics(client, _network("net-down"))
+    assert REGISTRY.get_sample_value("eero_network_clients_count", labels) == 0
+    assert REGISTRY.get_sample_value("eero_guest_network_connected_clients", labels) == 0
+    assert _connected_sample("net-down", "d1") == 0
+
+
+class _SessionClient:
+    """EeroClient stand-in whose requests fail while its session is expired."""
+
+    def __init__(self, expired: bool) -> None:
+        self.expired = expired
+        self.closed = False
+
+    async def open(self) -> "_SessionClient":
+        return self
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def get_networks(self) -> list[dict[str, Any]]:
+        if self.expired:
+            raise EeroAuthError("Session expired")
+        return [{"url": "/2.2/networks/net-auth", "name": "Home"}]
+
+
+async def _skip_network(client: Any, network_data: dict[str, Any]) -> None:
+    """Stand-in for the per-network collection, which these tests do not exercise."""
+
+
+def _auth_errors() -> float:
+    labels = {"error_type": "auth"}
+    return REGISTRY.get_sample_value("eero_exporter_scrape_errors_total", labels) or 0.0
+
+
+def _session_collector(
+    monkeypatch: pytest.MonkeyPatch, clients: list[_SessionClient]
+) -> EeroCollector:
+    """Build a collector that opens the given clients in order."""
+    opened = iter(clients)
+    monkeypatch.setattr(collector_module, "EeroClient", lambda **kwargs: next(opened))
+    collector = EeroCollector()
+    monkeypatch.setattr(collector, "_collect_network_metrics", _skip_network)
+    return collector
+
+
+async def test_collect_reopens_client_after_auth_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An auth error closes the client and retries once with a reopened one."""
+    clients = [_SessionClient(expired=True), _SessionClient(expired=False)]
+    collector = _session_collector(monkeypatch, clients)
+    errors = _auth_errors()
+
+    assert await collector.collect()
+    assert clients[0].closed
+    assert collector._client is clients[1]
+    assert _auth_errors() == errors
+
+
+async def test_collect_counts_repeated_auth_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second auth error in the same collection is reported as an auth failure."""
+    clients = [_SessionClient(expired=True), _SessionClient(expired=True)]
+    collector = _session_collector(monkeypatch, clients)
+    errors = _auth_errors()
+
+    assert not await collector.collect()
+    assert all(client.closed for client in clients)
+    assert collector._client is None
+    assert _auth_errors() == errors + 1
+
+
+class _BackupClient:
+    """API client stub for the backup endpoints, recording the endpoints called."""
+
+    def __init__(self, config_error: bool) -> None:
+        self.config_error = config_error
+        self.calls: list[str] = []
+
+    async def get_backup_network(self, network_id: str) -> dict[str, Any]:
+        self.calls.append("get_backup_network")
+        if self.config_error:
+            raise EeroAPIError("Backup network unavailable")
+        return {"enabled": True}
+
+    async def get_backup_status(self, network_id: str) -> dict[str, Any]:
+        self.calls.append("get_backup_status")
+        return {"active": False, "connected": True}
+
+
+async def test_backup_status_not_fetched_without_config() -> None:
+    """The backup status is only requested once the backup config has loaded."""
+    collector = EeroCollector()
+    client: Any = _BackupClient(config_error=True)
+
+    await collector._collect_backup_metrics(client, "net-backup")
+    assert client.calls == ["get_backup_network"]
+
+    client.config_error = False
+    await collector._collect_backup_metrics(client, "net-backup")
+    assert client.calls == ["get_backup_network", "get_backup_network", "get_backup_status"]
+    assert REGISTRY.get_sample_value("eero_backup_connected", {"network_id": "net-backup"}) == 1
+
+
+class _SqmUpstream:
+    """Upstream eero-api client returning a fixed SQM settings envelope."""
+
+    async def get_sqm_settings(self, network_id: str) -> dict[str, Any]:
+        return {"meta": {"code": 200}, "data": {"upload_bandwidth": 20}}
+
+
+def _sqm_requests(status: str) -> float:
+    labels = {"endpoint": "sqm", "status": status}
+    return REGISTRY.get_sample_value("eero_exporter_api_requests_total", labels) or 0.0
+
+
+async def test_cached_settings_are_counted_as_cached() -> None:
+    """A settings response served from the client's cache is not counted as a request."""
+    client = EeroClient(cache_ttl=300)
+    client._client = _SqmUpstream()
+    collector = EeroCollector()
+    success, cached = _sqm_requests("success"), _sqm_requests("cached")
+
+    await collector._collect_sqm_metrics(client, "net-sqm")
+    await collector._collect_sqm_metrics(client, "net-sqm")
+    assert _sqm_requests("success") == success + 1
+    assert _sqm_requests("cached") == cached + 1
@@ -0,0 +1,39 @@
+"""Tests for the exporter configuration."""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("eero")
+pytest.importorskip("yaml")
+
+from eero_exporter.config import ExporterConfig  # noqa: E402
+from eero_exporter.eero_adapter import DEFAULT_CACHE_TTL, DEFAULT_MAX_CONCURRENCY  # noqa: E402
+
+
+def test_defaults_match_the_adapter() -> None:
+    """The config defaults are the adapter's own defaults."""
+    config = ExporterConfig()
+    assert config.cache_ttl == DEFAULT_CACHE_TTL
+    assert config.max_concurrency == DEFAULT_MAX_CONCURRENCY
+
+
+def test_from_file_reads_max_concurrency(tmp_path: Path) -> None:
+    """A valid max_concurrency is loaded from the config file."""
+    path = tmp_path / "config.yml"
+    path.write_text("max_concurrency: 2\n")
+    assert ExporterConfig.from_file(path).max_concurrency == 2
+
+
+@pytest.mark.parametrize("value", [0, -1])
+def test_max_concurrency_below_one_is_rejected(value: int) -> None:
+    """A concurrency limit below 1 would block every request, so it is refused."""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        ExporterConfig(max_concurrency=value)
+
+
+def test_from_file_falls_back_to_defaults_on_invalid_max_concurrency(tmp_path: Path) -> None:
+    """A config file with an invalid max_concurrency is rejected as a whole."""
+    path = tmp_path / "config.yml"
+    path.write_text("port: 9100\nmax_concurrency: 0\n")
+    assert ExporterConfig.from_file(path) == ExporterConfig()
@@ -0,0 +1,205 @@
+"""Tests for the eero API adapter."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("eero")
+
+from eero_exporter import eero_adapter  # noqa: E402
+from eero_exporter.eero_adapter import (  # noqa: E402
+    EeroClient,
+    _cached_response,
+    _first_network_id,
+    extract_id_from_url,
+    served_from_cache,
+)
+
+
+class _Clock:
+    """Stand-in for the time module with a manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class _CachedEndpoint:
+    """Minimal object carrying the attributes _cached_response relies on."""
+
+    def __init__(self, cache_ttl: float) -> None:
+        self._cache_ttl = cache_ttl
+        self._response_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        self.calls = 0
+
+    @_cached_response
+    async def get_settings(self, network_id: str, **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        return {"network_id": network_id, "sqm": {"upload": 20}}
+
+
+class _Upstream:
+    """Upstream eero-api client returning a fixed SQM settings envelope."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_sqm_settings(self, network_id: str) -> dict[str, Any]:
+        self.calls += 1
+        return {"meta": {"code": 200}, "data": {"upload_bandwidth": 20}}
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Replace the adapter's clock so cache expiry can be stepped."""
+    fake = _Clock()
+    monkeypatch.setattr(eero_adapter, "time", SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+async def test_cached_response_reuses_result_until_ttl_expires(clock: _Clock) -> None:
+    """A cached result is reused within the TTL and refetched once it expires."""
+    endpoint = _CachedEndpoint(cache_ttl=300)
+
+    await endpoint.get_settings("n1")
+    clock.now += 299
+    await endpoint.get_settings("n1")
+    assert endpoint.calls == 1
+
+    clock.now += 2
+    await endpoint.get_settings("n1")
+    assert endpoint.calls == 2
+
+
+async def test_cached_response_keys_on_arguments() -> None:
+    """Different positional or keyword arguments are cached separately."""
+    endpoint = _CachedEndpoint(cache_ttl=300)
+
+    await endpoint.get_settings("n1")
+    await endpoint.get_settings("n2")
+    await endpoint.get_settings("n1", page=2)
+    await endpoint.get_settings("n1", page=2)
+    assert endpoint.calls == 3
+
+
+async def test_cached_response_returns_independent_copies() -> None:
+    """Mutating a returned value, including nested dicts, does not touch the cache."""
+    endpoint = _CachedEndpoint(cache_ttl=300)
+
+    missed = await endpoint.get_settings("n1")
+    missed["sqm"]["upload"] = 50
+    hit = await endpoint.get_settings("n1")
+    hit["sqm"]["upload"] = 80
+    hit["extra"] = True
+
+    assert await endpoint.get_settings("n1") == {"network_id": "n1", "sqm": {"upload": 20}}
+    assert endpoint.calls == 1
+
+
+async def test_cached_response_disabled_with_zero_ttl() -> None:
+    """A TTL of 0 calls through every time and stores nothing."""
+    endpoint = _CachedEndpoint(cache_ttl=0)
+
+    await endpoint.get_settings("n1")
+    await endpoint.get_settings("n1")
+    assert endpoint.calls == 2
+    assert endpoint._response_cache == {}
+
+
+async def test_served_from_cache_reports_the_last_call() -> None:
+    """Only a call answered from the cache is reported as served from it."""
+    endpoint = _CachedEndpoint(cache_ttl=300)
+
+    await endpoint.get_settings("n1")
+    assert not served_from_cache()
+    await endpoint.get_settings("n1")
+    assert served_from_cache()
+    await endpoint.get_settings("n2")
+    assert not served_from_cache()
+
+
+async def test_served_from_cache_is_per_task() -> None:
+    """A cache hit in another task is not reported to the caller's task."""
+    endpoint = _CachedEndpoint(cache_ttl=300)
+
+    await endpoint.get_settings("n1")
+    await asyncio.create_task(endpoint.get_settings("n1"))
+    assert endpoint.calls == 1
+    assert not served_from_cache()
+
+
+async def test_cache_hit_does_not_take_a_request_slot() -> None:
+    """Cached responses are served even while every request slot is busy."""
+    upstream = _Upstream()
+    client = EeroClient(cache_ttl=300, max_concurrency=1)
+    client._client = upstream
+
+    assert await client.get_sqm_settings("n1") == {"upload_bandwidth": 20}
+
+    async with client._request_slots:
+        settings = await asyncio.wait_for(client.get_sqm_settings("n1"), timeout=1)
+    assert settings == {"upload_bandwidth": 20}
+    assert upstream.calls == 1
+
+
+class _SlowUpstream:
+    """Upstream eero-api client tracking how many get_network calls overlap."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def get_network(self, network_id: str) -> dict[str, Any]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return {"meta": {"code": 200}, "data": {"url": f"/2.2/networks/{network_id}"}}
+
+
+async def test_max_concurrency_caps_in_flight_requests() -> None:
+    """No more than max_concurrency requests reach the eero API at once."""
+    upstream = _SlowUpstream()
+    client = EeroClient(max_concurrency=2)
+    client._client = upstream
+
+    networks = await asyncio.gather(*(client.get_network(f"n{i}") for i in range(5)))
+    assert [n["url"] for n in networks] == [f"/2.2/networks/n{i}" for i in range(5)]
+    assert upstream.peak == 2
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("/2.2/networks/12345", "12345"),
+        ("/2.2/networks/12345/", "12345"),
+        ("/2.2/networks/12345?expand=true", "12345"),
+        ("/2.2/networks/12345/#devices", "12345"),
+        ("/2.2/eeros/678?a=1#frag", "678"),
+        ("12345", "12345"),
+        ("", ""),
+        (None, ""),
+    ],
+)
+def test_extract_id_from_url(url: Any, expected: str) -> None:
+    """The trailing path segment is returned without query or fragment."""
+    assert extract_id_from_url(url) == expected
+    assert EeroClient.extract_network_id(url) == expected
+
+
+@pytest.mark.parametrize(
+    ("networks", "expected"),
+    [
+        ([{"url": "/2.2/networks/12345"}, {"url": "/2.2/networks/678"}], "12345"),
+        ([{"url": "/2.2/networks/12345?expand=true"}], "12345"),
+        ([{"name": "Home"}], None),
+        ([], None),
+    ],
+)
+def test_first_network_id(networks: list[dict[str, Any]], expected: str | None) -> None:
+    """The ID comes from the first network's URL, or None without one."""
+    assert _first_network_id(networks) == expected